@@ -0,0 +1,73 @@
+import abc
+import hashlib
+
+from datetime import datetime
+from typing import Any, Optional, Tuple
+
+from django.db.models import Count, Max, QuerySet
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+Validators = Tuple[Optional[str], Optional[datetime]]
+
+
+def make_etag(*parts: Any) -> str:
+    """Return a strong, quoted ETag for the given parts."""
+    return quote_etag(hashlib.sha256(repr(parts).encode()).hexdigest())
+
+
+def query_key(request: Request) -> list:
+    """The request's query parameters in a stable order, for validators of responses that depend on them."""
+    return sorted(request.query_params.lists())
+
+
+def queryset_stamp(queryset: QuerySet) -> Tuple[Optional[datetime], int]:
+    """Return the latest ``updated`` time and the number of rows in a queryset.
+
+    Together they change whenever a row is added, edited or removed, so they can stand in for a list's content.
+    """
+    stamp = queryset.order_by().aggregate(last_updated=Max("updated"), count=Count("pk"))
+
+    return stamp["last_updated"], stamp["count"]
+
+
+class ConditionalGetMixin(abc.ABC):
+    """Answer conditional GET requests before the response body is built.
+
+    Views return an ETag and/or a last modified time from ``get_validators``; a request whose If-None-Match or
+    If-Modified-Since matches them gets a 304 without running the view's handler. Responses for publicly readable
+    data may be stored by shared caches; everything else is private to the requesting user and revalidated on every
+    use.
+    """
+    public_cache = False
+    cache_max_age = 0
+
+    @abc.abstractmethod
+    def get_validators(self, request: Request) -> Validators:
+        """Return the ETag and last modified time of the response to a request; either may be None."""
+
+    def _patch_cache_headers(self, response, etag: Optional[str], last_modified: Optional[datetime]):
+        if etag:
+            response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+
+        if self.public_cache:
+            patch_cache_control(response, public=True, max_age=self.cache_max_age, must_revalidate=True)
+        else:
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ("Authorization", "Cookie"))
+
+    def get(self, request: Request, *args, **kwargs) -> Response:
+        etag, last_modified = self.get_validators(request)
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        if (response := get_conditional_response(request, etag=etag, last_modified=timestamp)) is None:
+            response = super().get(request, *args, **kwargs)
+
+        if response.status_code in (200, 304):
+            self._patch_cache_headers(response, etag, last_modified)
+
+        return response
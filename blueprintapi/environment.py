@@ -41,6 +41,7 @@ class Environment:
         self.cors_allow_origins = cors_origin
         self.debug = os.environ.get("API_DEBUG", True)
         self.secret_key = os.environ.get("SECRET_KEY", defaul_secret_key)
+        self.catalog_preload = os.environ.get("CATALOG_PRELOAD", "False").capitalize() == "True"
 
         # Log basic environment variables except db related for security reasons.
         logger.info("============== Environment Variables ================")
@@ -53,6 +54,7 @@ class Environment:
         logger.info("Cors allow origin     : %s", self.cors_allow_origins)
         logger.info("Debug                 : %s", self.debug)
         logger.info("CSRF Trusted Origins  : %s", self.csrf_trusted_origins)
+        logger.info("Catalog Preload       : %s", self.catalog_preload)
         logger.info("============== End Environment Variables ================")
 
     def get_allowed_hosts(self):
@@ -93,3 +95,6 @@ class Environment:
 
     def get_secret_key(self):
         return self.secret_key
+
+    def get_catalog_preload(self):
+        return self.catalog_preload
@@ -0,0 +1,60 @@
+from typing import Optional, Set
+
+from rest_framework import serializers
+from rest_framework.request import Request
+
+
+def query_param_set(request: Optional[Request], param: str) -> Set[str]:
+    """The comma separated values of a query parameter, which may be given more than once."""
+    if request is None:
+        return set()
+
+    return {item for value in request.query_params.getlist(param) for item in value.split(",") if item}
+
+
+def expands(request: Optional[Request], field: str) -> bool:
+    """Whether a request asks for a field with ``?expand=`` or ``?fields=``."""
+    return field in query_param_set(request, "expand") | query_param_set(request, "fields")
+
+
+class SparseFieldsetMixin:
+    """Serializer mixin limiting the fields returned to those a request asks for.
+
+    ``?fields=status,remarks`` returns only the listed fields of the top level serializer, and names it does not
+    have are rejected with a 400. Fields named in ``Meta.expandable_fields`` are left out unless they are listed in
+    ``?expand=`` (at any level) or ``?fields=``.
+    Fields left out are never read, so their method fields and nested serializers cost nothing; writable ones are
+    only made write only, so requests can still update them.
+    """
+
+    def get_fields(self) -> dict:
+        fields = super().get_fields()
+        request = self.context.get("request")
+        expanded = query_param_set(request, "expand")
+        requested = query_param_set(request, "fields") if self._is_top_level() else set()
+        expandable = getattr(getattr(self, "Meta", None), "expandable_fields", ())
+
+        if unknown := requested - set(fields):
+            raise serializers.ValidationError({"fields": f"Unknown fields: {', '.join(sorted(unknown))}."})
+
+        for name, field in list(fields.items()):
+            if requested:
+                wanted = name in requested or name in expanded
+            else:
+                wanted = name not in expandable or name in expanded
+
+            if wanted:
+                continue
+
+            if field.read_only:
+                del fields[name]
+            else:
+                field.write_only = True
+
+        return fields
+
+    def _is_top_level(self) -> bool:
+        """Whether this is the serializer of the response, or the child of the list serializer of the response."""
+        parent = getattr(self, "parent", None)
+
+        return parent is None or (parent is self.root and isinstance(self.root, serializers.ListSerializer))
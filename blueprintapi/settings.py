@@ -131,9 +131,25 @@ DATABASES = {
     }
 }
 
+TEST_RUNNER = "testing_utils.TemporaryMediaTestRunner"
+
 AUTH_USER_MODEL = "users.User"
 AUTH_TOKEN_TTL = 24  # Hours
 
+# Maximum number of parsed catalogs kept in memory by each process (see catalogs.registry). Catalogs are cached once per
+# parser, so this fits the six standard catalogs with each of the three parsers.
+CATALOG_CACHE_SIZE = 18
+# Maximum number of parsed component definitions kept in memory by each process (see components.registry).
+COMPONENT_CACHE_SIZE = 128
+# Catalog files of at least this many bytes are ingested incrementally instead of being loaded whole.
+CATALOG_STREAMING_THRESHOLD = 8 * 1024 * 1024
+# Directory of the binary catalog snapshots that catalog readers load instead of the JSON files (see catalogs.io).
+CATALOG_SNAPSHOT_DIR = os.path.join(BASE_DIR, "cache", "catalog_snapshots")
+# Seconds that browsers and shared caches may reuse catalog responses before revalidating them.
+CATALOG_HTTP_MAX_AGE = 300
+# Parse every catalog when the app starts, e.g. in the gunicorn master with --preload (see catalogs.apps).
+CATALOG_PRELOAD = environment.get_catalog_preload()
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
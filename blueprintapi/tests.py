@@ -4,11 +4,13 @@ import tempfile
 import time
 
 from django.test import SimpleTestCase
-from rest_framework import status
+from rest_framework import serializers, status
 from rest_framework.authtoken.models import Token
-from rest_framework.test import APITestCase
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
 
 from blueprintapi.oscal.component import Model
+from blueprintapi.serializers import SparseFieldsetMixin
 from users.models import User
 
 
@@ -168,3 +170,64 @@ class ComponentModelTestCase(SimpleTestCase):
     def test_control_ids(self):
         component = Model(**COMPONENT_DATA)
         self.assertEqual(sorted(component.component_definition.components[0].control_ids), ['ac-11', 'ac-3', 'ac-7'])
+
+
+class ItemSerializer(SparseFieldsetMixin, serializers.Serializer):  # pylint: disable=abstract-method
+    name = serializers.CharField()
+    notes = serializers.CharField(required=False)
+    summary = serializers.SerializerMethodField()
+    document = serializers.JSONField(read_only=True)
+
+    class Meta:
+        expandable_fields = ("document", )
+
+    def get_summary(self, obj: dict) -> str:
+        obj["summarized"] = True
+        return obj["name"].upper()
+
+
+class GroupSerializer(SparseFieldsetMixin, serializers.Serializer):  # pylint: disable=abstract-method
+    title = serializers.CharField()
+    items = ItemSerializer(many=True)
+
+
+class SparseFieldsetMixinTestCase(SimpleTestCase):
+    def setUp(self):
+        self.item = {"name": "first", "notes": "a note", "document": {"key": "value"}}
+
+    @staticmethod
+    def _context(query: str = "") -> dict:
+        return {"request": Request(APIRequestFactory().get(f"/api/items/{query}"))}
+
+    def test_all_fields_but_expandable_by_default(self):
+        data = ItemSerializer(self.item, context=self._context()).data
+
+        self.assertDictEqual(data, {"name": "first", "notes": "a note", "summary": "FIRST"})
+
+    def test_fields_skips_unrequested_method_fields(self):
+        data = ItemSerializer(self.item, context=self._context("?fields=name,notes")).data
+
+        self.assertDictEqual(data, {"name": "first", "notes": "a note"})
+        self.assertNotIn("summarized", self.item)
+
+    def test_expand(self):
+        data = ItemSerializer([self.item], many=True, context=self._context("?expand=document")).data
+
+        self.assertDictEqual(data[0]["document"], {"key": "value"})
+
+    def test_fields_only_apply_to_top_level(self):
+        group = {"title": "Group", "items": [self.item]}
+        data = GroupSerializer(group, context=self._context("?fields=items&expand=document")).data
+
+        self.assertListEqual(list(data), ["items"])
+        self.assertListEqual(list(data["items"][0]), ["name", "notes", "summary", "document"])
+
+    def test_unknown_fields_are_rejected(self):
+        with self.assertRaises(serializers.ValidationError):
+            _ = ItemSerializer(self.item, context=self._context("?fields=name,prose")).data
+
+    def test_unrequested_writable_fields_are_still_accepted(self):
+        serializer = ItemSerializer(data={"name": "second", "notes": "new"}, context=self._context("?fields=name"))
+
+        self.assertTrue(serializer.is_valid())
+        self.assertDictEqual(dict(serializer.validated_data), {"name": "second", "notes": "new"})
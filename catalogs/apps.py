@@ -1,19 +1,53 @@
+import gc
+import logging
+
 from django.apps import AppConfig
+from django.conf import settings
+from django.db import DatabaseError, connections
 from django.db.models.signals import post_save, post_delete, pre_save
 
+logger = logging.getLogger(__name__)
+
 
 class CatalogConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "catalogs"
 
     def ready(self):
-        from catalogs.signals import add_controls, auto_delete_file_on_delete, auto_delete_file_on_change
+        from catalogs.signals import (
+            add_controls, auto_delete_file_on_delete, auto_delete_file_on_change, invalidate_catalog_cache
+        )
 
         signal_config = [
             (post_save, add_controls, "ingest_catalog_controls"),
             (post_delete, auto_delete_file_on_delete, "remove_catalog_media"),
             (pre_save, auto_delete_file_on_change, "remove_stale_media"),
+            (post_save, invalidate_catalog_cache, "invalidate_saved_catalog_cache"),
+            (post_delete, invalidate_catalog_cache, "invalidate_deleted_catalog_cache"),
         ]
 
         for signal, receiver, uid in signal_config:
             signal.connect(receiver, sender="catalogs.Catalog", dispatch_uid=uid)
+
+        if settings.CATALOG_PRELOAD:
+            self.preload_catalogs()
+
+    @staticmethod
+    def preload_catalogs():
+        """Parse every catalog into the catalog registry before the server forks its workers.
+
+        Workers forked afterwards share these pages copy-on-write. gc.freeze keeps the garbage collector from touching
+        the parsed catalogs, which would otherwise give each worker its own copy.
+        """
+        from catalogs.registry import catalog_registry
+
+        try:
+            count = catalog_registry.preload()
+        except DatabaseError as exc:  # E.g. before the first migration.
+            logger.warning("Catalogs were not preloaded: %s", exc)
+            return
+        finally:
+            connections.close_all()  # Forked workers must not share this process's database connections.
+
+        gc.freeze()
+        logger.info("Preloaded %s catalogs.", count)
@@ -1,37 +1,78 @@
 import json
 import logging
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from catalogs.io.snapshot import read_snapshot
 
 logger = logging.getLogger("catalogs.catalogio")
 
 
+# The lookup indexes and rendering caches are built once per catalog, next to the accessors that use them.
+# pylint: disable-next=too-many-instance-attributes,too-many-public-methods
 class CatalogTools:
     """Represent a catalog"""
 
     def __init__(self, source, text=False):
-        try:
-            self.oscal = self._load_catalog_json(source, text)
-        except (IOError, FileNotFoundError, json.decoder.JSONDecodeError) as exc:
-            logger.error("Unable to load catalog %s: %s", source, exc)
-            raise CatalogLoadError(f"Could not load catalog {source}") from exc
+        """Load a catalog from a file path, a JSON string (text=True), or an already parsed document."""
+        if isinstance(source, dict):
+            self.oscal = source.get("catalog")
+        else:
+            try:
+                self.oscal = self._load_catalog_json(source, text)
+            except (IOError, FileNotFoundError, json.decoder.JSONDecodeError) as exc:
+                logger.error("Unable to load catalog %s: %s", source, exc)
+                raise CatalogLoadError(f"Could not load catalog {source}") from exc
 
-        json.dumps(self.oscal)
         self.status = "ok"
         self.status_message = "Success loading catalog"
         self.catalog_id = self.oscal.get("id")
         self.info = {"groups": self.get_groups()}
+        self._build_index()
 
     @staticmethod
     def _load_catalog_json(source, text):
-        """Read catalog file - JSON"""
+        """Read catalog file - JSON, or its binary snapshot when one is up to date"""
         oscal: dict = {}
         if text:
             oscal = json.loads(source)
+        elif (snapshot := read_snapshot(source)) is not None:
+            oscal = snapshot
         else:
             with open(source, "r") as file:
                 oscal = json.load(file)
         return oscal.get("catalog")
 
+    def _build_index(self):
+        """Index groups and controls once at load time so lookups do not rescan the catalog."""
+        self._groups_by_id: Dict[str, dict] = {}
+        self._controls: List[dict] = []
+        self._controls_all: List[dict] = []
+        self._enhancements: List[dict] = []
+        self._controls_by_id: Dict[str, dict] = {}
+        self._family_by_control_id: Dict[str, str] = {}
+        # Rendered statements and content of this catalog's controls, by control id.
+        self._statements: Dict[str, List[dict]] = {}
+        self._contents: Dict[str, dict] = {}
+
+        for group in self.get_groups():
+            group_id = group.get("id")
+            self._groups_by_id.setdefault(group_id, group)
+
+            for control in group.get("controls", []):
+                enhancements = control.get("controls", [])
+                self._controls.append(control)
+                self._controls_all += [control, *enhancements]
+                self._enhancements += enhancements
+
+                for item in (control, *enhancements):
+                    self._controls_by_id.setdefault(item["id"], item)
+                    self._family_by_control_id.setdefault(item["id"], group_id)
+
+        self._sorted_control_ids: List[str] = sorted((item["id"] for item in self._controls), key=control_sort_key)
+        self._control_position: Dict[str, int] = {
+            control_id: idx for idx, control_id in enumerate(self._sorted_control_ids)
+        }
+
     @staticmethod
     def find_dict_by_value(search_in, search_key: str, search_value: str):
         """
@@ -65,75 +106,49 @@ class CatalogTools:
         return ids
 
     def get_group_title_by_id(self, group_id):
-        group = self.find_dict_by_value(self.get_groups(), "id", group_id)
+        group = self._groups_by_id.get(group_id)
         if group is None:
             return None
         return group.get("title")
 
     def get_group_id_by_control_id(self, control_id) -> str:
         """Return group id given id of a control"""
-        group_ids = self.get_group_ids()
+        if control_id in self._family_by_control_id:
+            return self._family_by_control_id[control_id]
+
+        # Fall back to matching the family prefix for ids that are not in the catalog.
         gid: str = ""
-        if group_ids:
-            for group in group_ids:
-                if group.lower() == control_id[:2].lower():
-                    gid = group
+        for group in self._groups_by_id:
+            if group.lower() == control_id[:2].lower():
+                gid = group
         return gid
 
     # Controls
     def get_controls(self) -> List:
-        controls: List[dict] = []
-        for group in self.get_groups():
-            controls += group.get("controls")
-        return controls
+        return list(self._controls)
 
     def get_control_ids(self) -> List:
-        def _sort(control_id_: str) -> Tuple[str, float]:
-            parts = control_id_.split("-")
-            sub = float(parts.pop(-1))
-            id_ = "-".join(parts)
-
-            return id_, sub
-
-        search_collection = self.get_controls()
-        return sorted((item.get("id") for item in search_collection), key=_sort)
+        return list(self._sorted_control_ids)
 
     def get_controls_all(self) -> List:
-        controls: List[dict] = []
-        for group in self.get_groups():
-            for control in group.get("controls"):
-                controls.append(control)
-                if "controls" in control:
-                    controls += control.get("controls")
-        return controls
+        return list(self._controls_all)
 
     def get_controls_all_ids(self) -> List:
-        search_collection = self.get_controls_all()
-        return [item["id"] for item in search_collection]
+        return [item["id"] for item in self._controls_all]
+
+    def get_enhancements(self) -> List:
+        """Return all control enhancements, flattened across controls."""
+        return list(self._enhancements)
 
     def get_control_by_id(self, control_id: str) -> dict:
-        """
-        Return the dictionary in an array of dictionaries with a key matching a value
-        """
-        search_array = self.get_controls_all()
-        search_key = "id"
-        search_value = control_id
-        result_dict: dict = next(
-            (
-                s
-                for s in search_array
-                if search_key in s and s[search_key] == search_value
-            ),
-            {},
-        )
-        return result_dict
+        """Return the control with a matching id, or an empty dict if the catalog has no such control."""
+        return self._controls_by_id.get(control_id, {})
 
     def get_next_control_by_id(self, control_id: str):
-        search_collection = self.get_control_ids()
         try:
-            next_idx = search_collection.index(control_id) + 1
-            return search_collection[next_idx]
-        except ValueError:
+            next_idx = self._control_position[control_id] + 1
+            return self._sorted_control_ids[next_idx]
+        except KeyError:
             logger.warning(
                 "Cannot determine next control. Provided control does not exist in catalog(s): %s", control_id
             )
@@ -142,12 +157,23 @@ class CatalogTools:
             logger.info("No new controls.")
             return ""
 
+    def _is_indexed(self, control: dict) -> bool:
+        """Whether control is part of this catalog, so its rendering can be stored for the life of the catalog."""
+        return self._controls_by_id.get(control.get("id")) is control
+
     def get_control_statement(self, control: dict) -> List:
+        """Return the nested statement prose of a control, rendered once per control of this catalog."""
+        if (text := self._statements.get(control.get("id"))) is not None and self._is_indexed(control):
+            return text
+
         statement = self.get_control_part_by_name(control, "statement")
-        text: List[dict] = []
+        text = []
         if statement:
             if "parts" in statement:
                 text = self.__get_parts(statement.get("parts"))
+
+        if self._is_indexed(control):
+            self._statements[control["id"]] = text
         return text
 
     def __get_parts(self, parts) -> List:
@@ -212,36 +238,59 @@ class CatalogTools:
 
     @staticmethod
     def __get_control_parameter_values(control) -> dict:
-        params: dict = {}
-        if "params" in control:
-            for param in control.get("params"):
-                pid = param.get("id")
-                if "values" in param:
-                    params[pid] = param.get("values")
-                elif "select" in param:
-                    select = param.get("select")
-                    howmany = select.get("how-many") if "how-many" in select else 1
-                    params[pid] = {
-                        howmany: select.get("choice"),
-                    }
-                else:
-                    params[pid] = param.get("label")
-        return params
+        return get_parameter_values(control.get("params", []))
 
-    def get_control_data_simplified(self, control_id) -> dict:
-        control = self.get_control_by_id(control_id)
-        family_id = self.get_group_id_by_control_id(control_id)
-        desc = self.get_control_statement(control)
+    def get_control_content(self, control: dict) -> dict:
+        """Return the rendered content of a control dict, which does not depend on the rest of the catalog."""
+        if (content := self._contents.get(control.get("id"))) is not None and self._is_indexed(control):
+            return content
+
+        content = self.__render_control_content(control)
+        if self._is_indexed(control):
+            self._contents[control["id"]] = content
+        return content
+
+    def render_controls(self) -> int:
+        """Render every control's statement and content now, so later reads do not write to a frozen catalog.
+
+        Returns the number of controls that had not been rendered yet.
+        """
+        rendered = 0
+        for control in self._controls_all:
+            if self._is_indexed(control) and control["id"] not in self._statements:
+                rendered += 1
+            self.get_control_statement(control)
+            try:
+                self.get_control_content(control)
+            except AttributeError:  # Statements whose first part has no prose cannot be summarized, nor cached.
+                continue
+
+        return rendered
+
+    def __render_control_content(self, control: dict) -> dict:
         implementation = self.get_control_part_by_name(control, "implementation")
         guidance = self.get_control_part_by_name(control, "guidance")
-        control_data = {
+
+        return {
             "label": self.get_control_property_by_name(control, "label"),
             "sort_id": self.get_control_property_by_name(control, "sort-id"),
             "title": control.get("title"),
-            "family": self.get_group_title_by_id(family_id),
-            "description": self.__get_simplified_prose(desc),
+            "description": self.__get_simplified_prose(self.get_control_statement(control)),
             "implementation": implementation.get("prose") if implementation else "",
             "guidance": guidance.get("prose") if guidance else "",
+        }
+
+    def get_control_data_simplified(self, control_id) -> dict:
+        content = self.get_control_content(self.get_control_by_id(control_id))
+        family_id = self.get_group_id_by_control_id(control_id)
+        control_data = {
+            "label": content["label"],
+            "sort_id": content["sort_id"],
+            "title": content["title"],
+            "family": self.get_group_title_by_id(family_id),
+            "description": content["description"],
+            "implementation": content["implementation"],
+            "guidance": content["guidance"],
             "next_id": self.get_next_control_by_id(control_id),
         }
 
@@ -261,6 +310,33 @@ class CatalogTools:
         return metadata.get("title", "")
 
 
+def control_sort_key(control_id: str) -> Tuple[str, float]:
+    """Sort key putting control ids in catalog order, for example ac-2 before ac-10."""
+    parts = control_id.split("-")
+    sub = float(parts.pop(-1))
+    id_ = "-".join(parts)
+
+    return id_, sub
+
+
+def get_parameter_values(params: List[dict]) -> dict:
+    """Map each OSCAL parameter id to its values, its choices keyed by how many may be chosen, or its label."""
+    values: dict = {}
+    for param in params:
+        pid = param.get("id")
+        if "values" in param:
+            values[pid] = param.get("values")
+        elif "select" in param:
+            select = param.get("select")
+            howmany = select.get("how-many") if "how-many" in select else 1
+            values[pid] = {
+                howmany: select.get("choice"),
+            }
+        else:
+            values[pid] = param.get("label")
+    return values
+
+
 class CatalogLoadError(ValueError):
     pass
 
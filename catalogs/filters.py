@@ -0,0 +1,12 @@
+from django_filters import rest_framework as filters
+
+from catalogs.models import Controls
+
+
+class ControlsFilter(filters.FilterSet):
+    family = filters.CharFilter(field_name="family", lookup_expr="iexact")
+    id = filters.BaseInFilter(field_name="control_id")
+
+    class Meta:
+        model = Controls
+        fields = ["family", "id"]
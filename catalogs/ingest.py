@@ -0,0 +1,153 @@
+import hashlib
+import json
+import logging
+import os
+
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from django.conf import settings
+from django.db import connection, transaction
+
+from blueprintapi.db import bulk_insert
+from catalogs.io.snapshot import write_snapshot
+from catalogs.io.stream import CatalogStream
+from catalogs.models import SEARCH_CONFIG, Catalog, Controls
+from catalogs.readers import get_reader_class, load_reader, next_ids_in_order
+
+logger = logging.getLogger(__name__)
+
+
+def parse_control_content(
+        catalog_file: str, version: str, document: Optional[dict] = None
+) -> Tuple[str, List[dict]]:
+    """Parse a catalog into its title and the ``Controls`` field values for each of its controls.
+
+    When the catalog document has already been parsed (e.g. during validation) it is used instead of reading the file.
+    """
+    reader = load_reader(version, document if document is not None else catalog_file)
+
+    return reader.title, reader.control_rows()
+
+
+def file_checksum(path: str) -> str:
+    """SHA-256 of a catalog file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def index_control_text(instance: Catalog):
+    """Compute the text search vectors of a catalog's controls.
+
+    Ids and titles rank highest, then statement prose, then implementation standards and guidance. ``to_tsvector`` on
+    the statement's JSON only indexes its string values, i.e. the prose and not the part labels.
+    """
+    controls = Controls._meta
+    quote_name = connection.ops.quote_name
+    control_id, title, statement, implementation, guidance = (
+        quote_name(controls.get_field(name).column)
+        for name in ("control_id", "title", "statement", "implementation", "guidance")
+    )
+    sql = (
+        f"UPDATE {quote_name(controls.db_table)} SET {quote_name(controls.get_field('search_vector').column)} = "
+        f"setweight(to_tsvector(%(config)s::regconfig, {control_id} || ' ' || {title}), 'A') || "
+        f"setweight(to_tsvector(%(config)s::regconfig, {statement}), 'B') || "
+        f"setweight(to_tsvector(%(config)s::regconfig, {implementation} || ' ' || {guidance}), 'C') "
+        f"WHERE {quote_name(controls.get_field('catalog').column)} = %(catalog)s"
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {"config": SEARCH_CONFIG, "catalog": instance.pk})
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def stream_controls(instance: Catalog, batch_size: int = 500) -> str:
+    """Ingest controls for a catalog file by walking it incrementally, returning the catalog title.
+
+    Rows are written in batches as they are parsed, so peak memory depends on the largest control rather than the size
+    of the catalog. Next ids need the whole sort order, so they are filled in afterwards.
+    """
+    stream_rows = get_reader_class(instance.version).stream_rows
+    order: List[Tuple] = []
+
+    with transaction.atomic(), open(instance.file_name.path, "rb") as file:
+        stream = CatalogStream(file)
+
+        for batch in _batched(stream_rows(stream, order), batch_size):
+            bulk_insert(Controls, (Controls(catalog=instance, **row) for row in batch))
+
+        next_ids = next_ids_in_order(order)
+        controls = []
+        for control in Controls.objects.filter(catalog=instance, control_id__in=next_ids).only("id", "control_id"):
+            control.next_id = next_ids[control.control_id]
+            controls.append(control)
+        Controls.objects.bulk_update(controls, ["next_id"], batch_size=batch_size)
+        index_control_text(instance)
+
+    return stream.title
+
+
+def ingest_controls(instance: Catalog) -> str:
+    """Create the Controls rows for a newly created Catalog, returning the catalog title.
+
+    Content prepared ahead of saving is used as is, along with the snapshot encoded with it. Otherwise, catalog files
+    at or above ``settings.CATALOG_STREAMING_THRESHOLD`` bytes are streamed, unless the document has already been
+    parsed during validation. Catalogs that are not streamed also get a binary snapshot for faster loading.
+    """
+    document, instance.parsed_document = instance.parsed_document, None
+    prepared, instance.prepared_content = instance.prepared_content, None
+    path = instance.file_name.path
+    instance.checksum = file_checksum(path)
+
+    if prepared is not None:
+        title, rows, snapshot = prepared
+        bulk_insert(Controls, (Controls(catalog=instance, **row) for row in rows))
+        index_control_text(instance)
+        if snapshot is not None:
+            build_snapshot(path, snapshot)
+
+        return title
+
+    if document is None and os.path.getsize(path) >= settings.CATALOG_STREAMING_THRESHOLD:
+        return stream_controls(instance)
+
+    if document is None:
+        with open(path, "rb") as file:
+            document = json.load(file)
+
+    title, rows = parse_control_content(path, instance.version, document=document)
+
+    bulk_insert(Controls, (Controls(catalog=instance, **row) for row in rows))
+    index_control_text(instance)
+    build_snapshot(path, document)
+
+    return title
+
+
+def build_snapshot(catalog_file: str, document: Optional[Union[dict, bytes]] = None) -> bool:
+    """Write the binary snapshot that catalog readers load instead of the JSON file.
+
+    document is the parsed catalog document or its ``encode_document`` bytes; without it, the file is parsed.
+
+    Readers fall back to the JSON file without a snapshot, so failures are logged rather than raised.
+    """
+    try:
+        if document is None:
+            with open(catalog_file, "rb") as file:
+                document = json.load(file)
+
+        write_snapshot(catalog_file, document)
+    except (OSError, ValueError) as exc:
+        logger.warning("Unable to write a snapshot of catalog %s: %s", catalog_file, exc)
+        return False
+
+    return True
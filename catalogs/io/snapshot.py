@@ -0,0 +1,93 @@
+import hashlib
+import logging
+import marshal
+import mmap
+import os
+import struct
+import sys
+
+from pathlib import Path
+from typing import Optional, Union
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".snapshot"
+SNAPSHOT_FORMAT = 1
+
+# Magic, snapshot format, Python major and minor version (marshal is version specific), source size and mtime.
+_HEADER = struct.Struct("<4sHBBQq")
+_MAGIC = b"BPCS"
+
+
+def snapshot_path(catalog_file: Union[str, Path]) -> Path:
+    """Return where the snapshot of a catalog file is stored.
+
+    Snapshots are only ever read from ``settings.CATALOG_SNAPSHOT_DIR``, never from the upload storage beside the
+    catalog files, and are named after a hash of the catalog file's absolute path.
+    """
+    catalog_file = Path(catalog_file).resolve()
+    digest = hashlib.sha256(str(catalog_file).encode()).hexdigest()[:16]
+
+    return Path(settings.CATALOG_SNAPSHOT_DIR) / f"{catalog_file.name}.{digest}{SNAPSHOT_SUFFIX}"
+
+
+def _source_header(catalog_file: Union[str, Path]) -> bytes:
+    stat = os.stat(catalog_file)
+
+    return _HEADER.pack(_MAGIC, SNAPSHOT_FORMAT, *sys.version_info[:2], stat.st_size, stat.st_mtime_ns)
+
+
+def encode_document(document: dict) -> bytes:
+    """The snapshot body of a parsed catalog document, e.g. to write it from another process than the one parsing it."""
+    return marshal.dumps(document)
+
+
+def write_snapshot(catalog_file: Union[str, Path], document: Union[dict, bytes]) -> Path:
+    """Write a binary snapshot of a parsed catalog document, or of its ``encode_document`` bytes.
+
+    The header records the size and modification time of the catalog file, so a snapshot is only used while the file
+    it was made from is unchanged.
+    """
+    path = snapshot_path(catalog_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}")
+
+    with open(temp_path, "wb") as file:
+        file.write(_source_header(catalog_file))
+        file.write(document if isinstance(document, bytes) else encode_document(document))
+
+    os.replace(temp_path, path)  # Readers never see a partly written snapshot.
+
+    return path
+
+
+def read_snapshot(catalog_file: Union[str, Path]) -> Optional[dict]:
+    """Return the catalog document from a catalog file's snapshot, or None if there is no up-to-date snapshot.
+
+    The snapshot is memory mapped, so its bytes are read from the page cache that every worker process shares rather
+    than copied into each process; the decoded document is still built privately in each process.
+    """
+    path = snapshot_path(catalog_file)
+
+    try:
+        expected = _source_header(catalog_file)
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped[:_HEADER.size] != expected:
+                logger.info("Ignoring stale catalog snapshot %s.", path)
+                return None
+
+            with memoryview(mapped) as view, view[_HEADER.size:] as data:
+                return marshal.loads(data)
+    except (OSError, ValueError, EOFError, TypeError) as exc:
+        if not isinstance(exc, FileNotFoundError):
+            logger.warning("Unable to read catalog snapshot %s: %s", path, exc)
+
+        return None
+
+
+def delete_snapshot(catalog_file: Union[str, Path]):
+    path = snapshot_path(catalog_file)
+    if os.path.isfile(path):
+        os.remove(path)
@@ -0,0 +1,170 @@
+import codecs
+import json
+
+from typing import Any, BinaryIO, Iterator, Optional, Tuple
+
+_WHITESPACE = " \t\n\r"
+
+
+class JSONStreamReader:
+    """Decode a JSON document from a file piece by piece.
+
+    Only the values that are explicitly decoded are held in memory, so a caller can walk into a large document and
+    decode one array element at a time.
+    """
+
+    def __init__(self, file: BinaryIO, chunk_size: int = 64 * 1024):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        # Incremental, so multibyte characters split across reads are decoded correctly.
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: Optional[int] = None) -> bool:
+        """Read more of the file into the buffer, dropping the part that has already been consumed."""
+        if self._eof:
+            return False
+
+        chunk = self._file.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+
+        text = self._text_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it; an empty string at the end of the file."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos:self._pos + 1]
+
+    def expect(self, char: str):
+        if (found := self.peek()) != char:
+            raise json.JSONDecodeError(f"Expected {char!r}, found {found!r}", self._buffer, self._pos)
+
+        self._pos += 1
+
+    def decode(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        read_size = self._chunk_size
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill(read_size):
+                    raise
+                read_size *= 2  # Grow reads geometrically so large values are not re-scanned too often.
+                continue
+
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and self._fill(read_size):
+                continue
+
+            self._pos = end
+
+            return value
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate over the keys of the next JSON object.
+
+        After each key is yielded the caller must consume its value, with decode, iter_object or iter_array.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = self.decode()
+            self.expect(":")
+
+            yield key
+
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+
+            self.expect("}")
+            return
+
+    def iter_array(self) -> Iterator[None]:
+        """Iterate over the items of the next JSON array; the caller must consume each item when it is yielded."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+
+        while True:
+            yield None
+
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+
+            self.expect("]")
+            return
+
+
+class CatalogStream:
+    """Walk the ``groups[].controls[]`` of an OSCAL catalog without loading the whole document.
+
+    Controls are yielded together with their group's members that precede the group's "controls" array, which in OSCAL
+    JSON are the group's id, class and title. The catalog metadata is available once it has been read, which for OSCAL
+    documents is before the first group.
+    """
+
+    def __init__(self, file: BinaryIO, chunk_size: int = 64 * 1024):
+        self._reader = JSONStreamReader(file, chunk_size=chunk_size)
+        self.metadata: dict = {}
+
+    def controls(self) -> Iterator[Tuple[dict, dict]]:
+        reader = self._reader
+
+        for key in reader.iter_object():
+            if key == "catalog":
+                yield from self._catalog()
+            else:
+                yield from self._catalog_member(key)
+
+    def _catalog(self) -> Iterator[Tuple[dict, dict]]:
+        for key in self._reader.iter_object():
+            yield from self._catalog_member(key)
+
+    def _catalog_member(self, key: str) -> Iterator[Tuple[dict, dict]]:
+        reader = self._reader
+
+        if key == "metadata":
+            self.metadata = reader.decode()
+        elif key == "groups":
+            for _ in reader.iter_array():
+                yield from self._group()
+        else:
+            reader.decode()  # Other members (uuid, back-matter, ungrouped controls...) are not ingested.
+
+    def _group(self) -> Iterator[Tuple[dict, dict]]:
+        reader = self._reader
+        group: dict = {}
+
+        for key in reader.iter_object():
+            if key == "controls":
+                for _ in reader.iter_array():
+                    yield group, reader.decode()
+            else:
+                group[key] = reader.decode()
+
+    @property
+    def title(self) -> str:
+        return self.metadata.get("title", "")
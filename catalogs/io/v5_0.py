@@ -2,13 +2,58 @@ import json
 import logging
 
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal, Optional, Union
+from typing import Literal, Optional, Type, TypeVar, Union
+from uuid import UUID
 
-from pydantic import BaseModel, Field, UUID4, ValidationError, validator  # pylint: disable=no-name-in-module
+from pydantic import BaseModel, Field, PrivateAttr, UUID4, ValidationError, validator  # pylint: disable=no-name-in-module
+from pydantic.fields import SHAPE_LIST  # pylint: disable=no-name-in-module
+
+from catalogs.io.snapshot import read_snapshot
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _construct_fields(model: Type[BaseModel]) -> tuple:
+    """(name, alias, nested model or None, is a list, field) for each field of a model."""
+    fields = []
+    for name, field in model.__fields__.items():
+        nested = field.type_ if isinstance(field.type_, type) and issubclass(field.type_, BaseModel) else None
+        fields.append((name, field.alias, nested, field.shape == SHAPE_LIST, field))
+
+    return tuple(fields)
+
+
+def _construct(model: Type[ModelT], data: dict) -> ModelT:
+    """Build a model and its nested models from data that is known to be valid, without validating it again.
+
+    Equivalent to BaseModel.construct applied recursively, which is too slow for the thousands of parts in a catalog.
+    """
+    values = {}
+    fields_set = set()
+    for name, alias, nested, many, field in _construct_fields(model):
+        if alias not in data:
+            values[name] = field.get_default()
+            continue
+
+        value = data[alias]
+        if nested is not None and value is not None:
+            value = [_construct(nested, item) for item in value] if many else _construct(nested, value)
+        values[name] = value
+        fields_set.add(name)
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__fields_set__", fields_set)
+    if model.__private_attributes__:
+        instance._init_private_attributes()  # pylint: disable=protected-access
+
+    return instance
+
 
 class CatalogMeta(BaseModel):
     class Meta:
@@ -71,10 +116,15 @@ class Part(BaseModel, FilterMixin):
 
 class Control(BaseControl, FilterMixin):
     family_id: Optional[str] = Field(default="", exclude=True)
+    params: Optional[list[dict]] = []
     props: Optional[list[Prop]] = []
     links: Optional[list[Link]] = []
     parts: Optional[list[Part]] = []
 
+    # Rendered statement, filled in by render() as CatalogModel indexes its controls.
+    _description: Optional[str] = PrivateAttr(default=None)
+    _statement_parts: Optional[list[dict]] = PrivateAttr(default=None)
+
     @property
     def sort_id(self) -> str:
         prop = self._get_prop("sort-id")
@@ -106,8 +156,7 @@ class Control(BaseControl, FilterMixin):
 
         return part.prose
 
-    @property
-    def description(self) -> str:
+    def _render_description(self) -> str:
         def _get_prose(item, depth=0):
             depth += 1
             tabs = "\t" * depth
@@ -125,12 +174,53 @@ class Control(BaseControl, FilterMixin):
 
         return "".join(parts).strip()
 
+    def _render_statement_parts(self) -> list[dict]:
+        def _render(parts_: list[Part]) -> list[dict]:
+            section = []
+            for part in parts_:
+                label = prop.value if (prop := part._get_prop("label")) else ""
+                prose = {label: part.prose} if "prose" in part.__fields_set__ else None
+                section.append({"prose": prose, "parts": _render(part.parts)})
+
+            return section
+
+        if not self.statement:
+            return []
+
+        return _render(self.statement.parts)
+
+    def render(self):
+        """Render the statement once, so description and statement_parts return the stored result."""
+        self._description = self._render_description()
+        self._statement_parts = self._render_statement_parts()
+
+    @property
+    def description(self) -> str:
+        """Statement prose flattened into indented, labelled lines."""
+        if self._description is None:
+            self.render()
+
+        return self._description
+
+    @property
+    def statement_parts(self) -> list[dict]:
+        """Nested statement prose keyed by part label, shaped like CatalogTools.get_control_statement."""
+        if self._statement_parts is None:
+            self.render()
+
+        return self._statement_parts
+
     def to_orm(self) -> dict:
         return {
             "control_id": self.id,
             "control_label": self.label,
             "sort_id": self.sort_id,
-            "title": self.title
+            "title": self.title,
+            "family": self.family_id,
+            "description": self.description,
+            "statement": self.statement_parts,
+            "implementation": self.implementation,
+            "guidance": self.guidance,
         }
 
 
@@ -152,20 +242,44 @@ class CatalogModel(BaseModel):
     metadata: CatalogMeta
     groups: list[Family]
 
+    # Sorted controls and lookup maps, computed once per instance.
+    _controls: list[Control] = PrivateAttr(default_factory=list)
+    _controls_by_id: dict[str, Control] = PrivateAttr(default_factory=dict)
+    _next_ids: dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        self.build_index()
+
+    def build_index(self):
+        """Render the controls and index them in catalog order; catalogs built with ``construct`` must call this."""
+        controls = sorted((item for group in self.groups for item in group.controls), key=lambda item: item.sort_id)
+
+        self._controls = controls
+        self._controls_by_id = {}
+        for control in controls:
+            control.render()
+            self._controls_by_id.setdefault(control.id, control)
+
+        # Map each id to the next distinct id; some catalogs repeat a control (e.g. ac-6.9 in ARS 5.0 moderate/high).
+        self._next_ids = {}
+        for control, next_control in zip(controls, controls[1:]):
+            if next_control.id != control.id:
+                self._next_ids[control.id] = next_control.id
+
     @property
     def controls(self) -> list[Control]:
-        return sorted((item for group in self.groups for item in group.controls), key=lambda control: control.sort_id)
+        return list(self._controls)
 
     def get_control(self, control_id: str) -> Optional[Control]:
-        return next(filter(lambda control: control.id == control_id, self.controls), None)
+        return self._controls_by_id.get(control_id)
 
     def get_next(self, control: Control) -> str:
-        try:
-            next_idx = self.controls.index(control) + 1
-            return self.controls[next_idx].id
-        except (ValueError, IndexError):
+        if control is None:
             return ""
 
+        return self._next_ids.get(control.id, "")
+
     def control_summary(self, control_id: str) -> dict:
         control = self.get_control(control_id)
         next_id = self.get_next(control)
@@ -184,9 +298,36 @@ class CatalogModel(BaseModel):
 
     @classmethod
     def from_json(cls, json_file: Union[str, Path]):
+        if (snapshot := read_snapshot(json_file)) is not None:
+            return cls.from_snapshot(snapshot)
+
         with open(json_file, "rb") as file:
             data = json.load(file)
 
+        return cls.from_document(data)
+
+    @classmethod
+    def from_snapshot(cls, data: dict):
+        """Build a catalog from a snapshot document, which was validated when its catalog was ingested.
+
+        Skipping validation makes this several times faster than from_document.
+        """
+        if "groups" not in data:
+            data = data["catalog"]
+
+        groups = [_construct(Family, group) for group in data["groups"]]
+        for group in groups:  # As Family.set_family_id does.
+            for item in group.controls:
+                if not item.family_id:
+                    item.family_id = group.id
+
+        catalog = cls.construct(uuid=UUID(data["uuid"]), metadata=CatalogMeta(**data["metadata"]), groups=groups)
+        catalog.build_index()
+
+        return catalog
+
+    @classmethod
+    def from_document(cls, data: dict):
         try:
             return cls(**data)
         except ValidationError:  # Try nested "catalog" field
@@ -0,0 +1,40 @@
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from blueprintapi.db import bulk_insert
+from catalogs.ingest import parse_control_content
+from catalogs.models import Catalog, Controls
+
+
+class Command(BaseCommand):
+    help = "Compare bulk_create with the COPY based bulk_insert for writing a catalog's Controls rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--catalog", type=str, default="CMS_ARS_5_0_HIGH", help="Name of a loaded catalog.")
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **options):
+        try:
+            catalog = Catalog.objects.get(name=options["catalog"])
+        except Catalog.DoesNotExist as exc:
+            raise CommandError(f"Catalog, {options['catalog']} has not been loaded.") from exc
+
+        _, rows = parse_control_content(catalog.file_name.path, catalog.version)
+        self.stdout.write(f"{catalog.name}: {len(rows)} rows, best of {options['repeat']}")
+
+        writers = {
+            "bulk_create": lambda objs: Controls.objects.bulk_create(objs, batch_size=1000),
+            "bulk_insert": lambda objs: bulk_insert(Controls, objs),
+        }
+
+        for name, write in writers.items():
+            def run(write=write):
+                # Every run is rolled back, so the catalog is left as it was.
+                with transaction.atomic():
+                    write([Controls(catalog=catalog, **row) for row in rows])
+                    transaction.set_rollback(True)
+
+            best = min(timeit.repeat(run, number=1, repeat=options["repeat"]))
+            self.stdout.write(f"  {name:<12} {best * 1000:8.1f} ms")
@@ -0,0 +1,39 @@
+import timeit
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from catalogs.io.v5_0 import CatalogModel
+
+DEFAULT_CATALOG = Path(__file__).parents[2] / "data" / "5.0" / "cms_ars_50_high.json"
+
+
+class Command(BaseCommand):
+    help = "Report the per-call cost of catalog lookups for an ARS 5.0 catalog file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--catalog-file", type=str, default=str(DEFAULT_CATALOG))
+        parser.add_argument("--repeat", type=int, default=5, help="Number of passes over every control.")
+
+    def handle(self, *args, **options):
+        catalog_file = Path(options["catalog_file"])
+        repeat = options["repeat"]
+
+        parse_time = timeit.timeit(lambda: CatalogModel.from_json(catalog_file), number=1)
+        catalog = CatalogModel.from_json(catalog_file)
+        control_ids = [control.id for control in catalog.controls]
+        controls = [catalog.get_control(control_id) for control_id in control_ids]
+
+        self.stdout.write(f"{catalog_file.name}: {len(control_ids)} controls, parsed in {parse_time * 1000:.1f} ms")
+
+        benchmarks = {
+            "get_control": lambda: [catalog.get_control(control_id) for control_id in control_ids],
+            "get_next": lambda: [catalog.get_next(control) for control in controls],
+            "control_summary": lambda: [catalog.control_summary(control_id) for control_id in control_ids],
+        }
+
+        for name, func in benchmarks.items():
+            total = timeit.timeit(func, number=repeat)
+            per_call = total / (repeat * len(control_ids))
+            self.stdout.write(f"  {name:<16} {per_call * 1e6:10.1f} us/call")
@@ -0,0 +1,43 @@
+import gc
+import json
+import tracemalloc
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from catalogs.catalogio import CatalogTools
+from catalogs.io.v5_0 import CatalogModel
+from catalogs.readers import CatalogReaderV50
+
+DEFAULT_CATALOG = Path(__file__).parents[2] / "data" / "5.0" / "cms_ars_50_high.json"
+
+
+class Command(BaseCommand):
+    help = "Compare the memory held by the dict, pydantic and compact (reader) forms of an ARS 5.0 catalog file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--catalog-file", type=str, default=str(DEFAULT_CATALOG))
+
+    def handle(self, *args, **options):
+        catalog_file = Path(options["catalog_file"])
+        with open(catalog_file, "rb") as file:
+            document = json.load(file)
+
+        forms = {
+            "dict": lambda: CatalogTools(json.loads(json.dumps(document))),
+            "pydantic": lambda: CatalogModel.from_document(document),
+            "compact": lambda: CatalogReaderV50.from_document(document),
+        }
+
+        self.stdout.write(f"{catalog_file.name}: {'held':>10} {'peak':>10}")
+        for name, load in forms.items():
+            gc.collect()
+            tracemalloc.start()
+            catalog = load()
+            gc.collect()
+            size, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del catalog
+
+            self.stdout.write(f"  {name:<16} {size / 2 ** 20:7.2f} MiB {peak / 2 ** 20:7.2f} MiB")
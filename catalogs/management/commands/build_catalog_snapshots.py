@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from catalogs.ingest import build_snapshot
+from catalogs.io.snapshot import read_snapshot
+from catalogs.models import Catalog
+
+
+class Command(BaseCommand):
+    help = "Write binary snapshots for catalogs that do not have an up-to-date one, e.g. catalogs loaded before them."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Rewrite snapshots that are already up to date.")
+
+    def handle(self, *args, **options):
+        for catalog in Catalog.objects.order_by("pk"):
+            path = catalog.file_name.path
+            if not options["force"] and read_snapshot(path) is not None:
+                self.stdout.write(f"Catalog, {catalog.name} already has a snapshot. Skipping.")
+                continue
+
+            if build_snapshot(path):
+                self.stdout.write(self.style.SUCCESS(f"Wrote snapshot for catalog '{catalog.name}'"))
+            else:
+                self.stdout.write(self.style.ERROR(f"Could not write a snapshot for catalog '{catalog.name}'"))
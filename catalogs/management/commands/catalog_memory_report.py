@@ -0,0 +1,64 @@
+import gc
+import os
+import time
+import tracemalloc
+
+from typing import Optional
+
+from django.core.management.base import BaseCommand
+
+from catalogs.models import Catalog
+from catalogs.registry import CatalogRegistry
+
+
+def _resident_size() -> Optional[int]:
+    """Return this process's resident set size in bytes, where /proc is available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class Command(BaseCommand):
+    help = "Report how long each catalog takes to load and how much memory the loaded catalog holds."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loader",
+            choices=list(CatalogRegistry.loaders),
+            default=CatalogRegistry.TOOLS,
+            help="Catalog representation to load; the model loader only supports ARS 5.0 catalogs.",
+        )
+
+    def handle(self, *args, **options):
+        load = CatalogRegistry.loaders[options["loader"]]
+        catalogs = Catalog.objects.order_by("pk")
+        if options["loader"] == CatalogRegistry.MODEL:
+            catalogs = catalogs.filter(version=Catalog.Version.CMS_ARS_5_0)
+
+        loaded = []  # Kept alive so the resident size covers every catalog, as in a preloaded server.
+        rss_before = _resident_size()
+        total_size = 0
+
+        for catalog in catalogs:
+            start = time.perf_counter()
+            try:
+                load(catalog)
+            except (OSError, ValueError) as exc:
+                self.stdout.write(self.style.ERROR(f"{catalog.name:<24} could not be loaded: {exc}"))
+                continue
+            load_time = time.perf_counter() - start
+
+            gc.collect()
+            tracemalloc.start()
+            loaded.append(load(catalog))
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            total_size += size
+
+            self.stdout.write(f"{catalog.name:<24} {load_time * 1000:8.1f} ms {size / 2 ** 20:8.1f} MiB")
+
+        self.stdout.write(f"{'Total':<24} {'':11} {total_size / 2 ** 20:8.1f} MiB")
+        if rss_before is not None and (rss_after := _resident_size()) is not None:
+            self.stdout.write(f"Resident size grew by {(rss_after - rss_before) / 2 ** 20:.1f} MiB")
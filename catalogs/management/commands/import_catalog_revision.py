@@ -0,0 +1,56 @@
+import json
+
+from pathlib import Path
+
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from jsonschema.exceptions import ValidationError
+
+from catalogs.models import Catalog, get_catalog_validator
+from catalogs.revisions import update_controls
+
+
+class Command(BaseCommand):
+    help = (
+        "Replace a catalog's file with a revised release, updating its controls and the controls of the projects that "
+        "use it in place."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--name", type=str, required=True, help="Name of the catalog to revise.")
+        parser.add_argument("--catalog-file", type=str, required=True)
+
+    def handle(self, *args, **options):
+        input_file = Path(options["catalog_file"])
+
+        try:
+            catalog = Catalog.objects.get(name=options["name"])
+        except Catalog.DoesNotExist as exc:
+            raise CommandError(f"Catalog, {options['name']} does not exist.") from exc
+
+        with open(input_file, "rb") as file:
+            document = json.load(file)
+            try:
+                get_catalog_validator().validate(document)
+            except ValidationError as exc:
+                raise CommandError(f"{input_file} is not a valid OSCAL catalog.") from exc
+
+            file.seek(0)
+            with transaction.atomic():
+                catalog.parsed_document = document
+                catalog.file_name.save(input_file.name, File(file), save=False)
+                # Revised before saving, so the save signal finds the controls already match the new file.
+                revision = update_controls(catalog)
+                catalog.save()
+
+        if revision.unchanged:
+            self.stdout.write(self.style.WARNING(f"Catalog '{catalog.name}' is unchanged."))
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Revised catalog '{catalog.name}': {revision.added} controls added, {revision.changed} changed, "
+                f"{revision.removed} removed"
+            )
+        )
@@ -1,15 +1,37 @@
+import json
 import re
+import time
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Tuple
+from typing import List, Optional, Tuple
+
+import django
 
 from django.core.files import File
 from django.core.management.base import BaseCommand, CommandError
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
+from catalogs.ingest import parse_control_content
+from catalogs.io.snapshot import encode_document
 from catalogs.models import Catalog
 
 
+PreparedContent = Tuple[str, List[dict], Optional[bytes]]
+
+
+def _parse_catalog_file(path: str, version: str) -> Tuple[PreparedContent, float]:
+    """Parse a catalog file in a worker process, returning the time taken and its title, Controls rows and encoded
+    snapshot, so the loading process never parses the file itself.
+    """
+    start = time.perf_counter()
+    with open(path, "rb") as file:
+        document = json.load(file)
+    title, rows = parse_control_content(path, version, document=document)
+
+    return (title, rows, encode_document(document)), time.perf_counter() - start
+
+
 class Command(BaseCommand):
     help = "Ingest catalog data into the Catalog and Control tables."
 
@@ -20,10 +42,19 @@ class Command(BaseCommand):
         parser.add_argument("--source", type=str, default=None)
         parser.add_argument("--catalog-version", type=str, default=None)
         parser.add_argument("--load-standard-catalogs", action="store_true")
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of processes used to parse the standard catalogs. Rows are still written by this process.",
+        )
 
     def handle(self, *args, **options):
+        if options["jobs"] < 1:
+            raise CommandError("--jobs must be at least 1.")
+
         if options["load_standard_catalogs"]:
-            self._load_standards()
+            self._load_standards(jobs=options["jobs"])
         else:
             input_file = Path(options["catalog_file"])
             name = input_name if (input_name := options["name"]) else input_file.name
@@ -34,15 +65,34 @@ class Command(BaseCommand):
 
             self._load_catalog(input_file, name, **create_kwargs)
 
-    def _load_catalog(self, input_file: Path, name: str, **catalog_args):
+    def _is_loaded(self, name: str) -> bool:
         if Catalog.objects.filter(name=name).exists():
             self.stdout.write(self.style.WARNING(f"Catalog, {name} has already been loaded. Skipping."))
-            return
+            return True
 
+        return False
+
+    def _load_catalog(
+            self,
+            input_file: Path,
+            name: str,
+            prepared_content: Optional[PreparedContent] = None,
+            **catalog_args
+    ) -> Optional[float]:
+        """Create a catalog and its controls in one transaction, returning the time taken or None if skipped.
+
+        prepared_content, when given, is used for the controls instead of parsing the file again.
+        """
+        if self._is_loaded(name):
+            return None
+
+        start = time.perf_counter()
         try:
-            with open(input_file, mode="rb") as catalog:
+            with open(input_file, mode="rb") as catalog, transaction.atomic():
                 file = File(catalog, name=input_file)
-                Catalog.objects.create(file_name=file, name=name, **catalog_args)
+                instance = Catalog(file_name=file, name=name, **catalog_args)
+                instance.prepared_content = prepared_content
+                instance.save(force_insert=True)
         except IntegrityError as exc:
             raise CommandError(f"Error in creating new catalog: {exc}") from exc
         except (IOError, FileNotFoundError) as exc:
@@ -50,6 +100,8 @@ class Command(BaseCommand):
 
         self.stdout.write(self.style.SUCCESS(f"Successfully ingested catalog '{name}'"))
 
+        return time.perf_counter() - start
+
     @staticmethod
     def _parse_standard_catalog_path(path: Path) -> Tuple[str, str, str]:
         """Parse Catalog information from the standard catalog naming convention and path."""
@@ -60,19 +112,68 @@ class Command(BaseCommand):
 
         return version, impact_level, name
 
-    def _load_standards(self):
-        """Load standard catalogs from catalogs/data"""
+    def _load_standards(self, jobs: int = 1):
+        """Load standard catalogs from catalogs/data
+
+        With more than one job, catalogs are parsed in a process pool and each one is written by this process as soon as
+        its rows are ready.
+        """
         source = "https://github.com/CMSgov/ars-machine-readable"  # See catalogs/data/README.md
 
         catalogs_path = Path(__file__).parents[2] / "data"
         catalog_files = list(catalogs_path.rglob("*json"))
         catalog_defs = [self._parse_standard_catalog_path(path) for path in catalog_files]
-
-        for (version, impact_level, name), file in zip(catalog_defs, catalog_files):
-            self._load_catalog(
-                input_file=file.relative_to(file.parents[3]),
-                name=name,
-                version=version,
-                impact_level=impact_level,
-                source=source
-            )
+        timings: List[Tuple[str, Optional[float], float]] = []
+
+        if jobs == 1:
+            for (version, impact_level, name), file in zip(catalog_defs, catalog_files):
+                elapsed = self._load_catalog(
+                    input_file=file.relative_to(file.parents[3]),
+                    name=name,
+                    version=version,
+                    impact_level=impact_level,
+                    source=source
+                )
+                if elapsed is not None:
+                    timings.append((name, None, elapsed))
+        else:
+            timings = self._load_standards_in_parallel(list(zip(catalog_defs, catalog_files)), source, jobs)
+
+        self._write_timings(timings)
+
+    def _load_standards_in_parallel(
+            self,
+            catalogs: List[Tuple[Tuple[str, str, str], Path]],
+            source: str,
+            jobs: int,
+    ) -> List[Tuple[str, Optional[float], float]]:
+        """Parse the standard catalogs that are not loaded yet in a process pool, writing each one as it is ready."""
+        timings: List[Tuple[str, Optional[float], float]] = []
+
+        # Workers only parse; Django is set up in each one so spawned processes can import the models.
+        with ProcessPoolExecutor(max_workers=jobs, initializer=django.setup) as executor:
+            futures = {
+                executor.submit(_parse_catalog_file, str(file), catalog_def[0]): (catalog_def, file)
+                for catalog_def, file in catalogs
+                if not self._is_loaded(catalog_def[2])
+            }
+            for future in as_completed(futures):
+                (version, impact_level, name), file = futures[future]
+                prepared_content, parse_time = future.result()
+                elapsed = self._load_catalog(
+                    input_file=file.relative_to(file.parents[3]),
+                    name=name,
+                    prepared_content=prepared_content,
+                    version=version,
+                    impact_level=impact_level,
+                    source=source
+                )
+                if elapsed is not None:
+                    timings.append((name, parse_time, elapsed))
+
+        return timings
+
+    def _write_timings(self, timings: List[Tuple[str, Optional[float], float]]):
+        for name, parse_time, load_time in sorted(timings):
+            parsed = f"parsed in {parse_time:.2f}s, " if parse_time is not None else ""
+            self.stdout.write(f"{name}: {parsed}loaded in {load_time:.2f}s")
@@ -0,0 +1,218 @@
+# Generated by Django 4.1.1 on 2026-10-18 08:04
+
+import json
+import logging
+import os
+
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+CONTENT_FIELDS = ("family", "description", "statement", "implementation", "guidance", "next_id")
+
+
+# The functions below are a frozen copy of how catalogs.ingest rendered control content when this migration was written
+# (CatalogTools for ARS 3.1, CatalogModel for ARS 5.0), working on the catalog document directly.
+
+def _find(items, key: str, value: str) -> dict:
+    return next((item for item in items or [] if item.get(key) == value), {})
+
+
+def _prop(item: dict, name: str, default=""):
+    prop = _find(item.get("properties", item.get("props")), "name", name)
+    return prop.get("value", default) if prop else default
+
+
+def _part(control: dict, name: str) -> dict:
+    return _find(control.get("parts"), "name", name)
+
+
+def _statement_v31(parts: list) -> list:
+    section = []
+    for part_data in parts:
+        prose = {_prop(part_data, "label"): part_data["prose"]} if "prose" in part_data else None
+        section.append({"prose": prose, "parts": _statement_v31(part_data.get("parts") or [])})
+
+    return section
+
+
+def _sort_v31(control_id: str):
+    parts = control_id.split("-")
+    sub = float(parts.pop(-1))
+
+    return "-".join(parts), sub
+
+
+def _rows_v31(catalog: dict) -> list:
+    groups, controls, families = {}, {}, {}
+    top_level = []
+    for group in catalog.get("groups", []):
+        groups.setdefault(group.get("id"), group)
+        for control in group.get("controls", []):
+            top_level.append(control["id"])
+            for item in (control, *control.get("controls", [])):
+                controls.setdefault(item["id"], item)
+                families.setdefault(item["id"], group.get("id"))
+
+    ordered = sorted(top_level, key=_sort_v31)
+    next_ids = dict(zip(ordered, ordered[1:]))
+
+    rows = []
+    for group in catalog.get("groups", []):
+        for control in group.get("controls", []):
+            for control_id in (item["id"] for item in (control, *control.get("controls", []))):
+                item = controls[control_id]
+                statement = _statement_v31(_part(item, "statement").get("parts") or [])
+                if statement and statement[0]["prose"]:
+                    description = next(iter(statement[0]["prose"].values()))
+                else:
+                    description = None
+                rows.append(
+                    {
+                        "control_id": control_id,
+                        "family": (groups.get(families[control_id]) or {}).get("title") or "",
+                        "description": description or "",
+                        "statement": statement,
+                        "implementation": _part(item, "implementation").get("prose") or "",
+                        "guidance": _part(item, "guidance").get("prose") or "",
+                        "next_id": next_ids.get(control_id, ""),
+                    }
+                )
+
+    return rows
+
+
+def _description_v50(statement: dict) -> str:
+    lines = []
+
+    def _add_prose(item: dict, depth: int):
+        depth += 1
+        if prose := item.get("prose"):
+            lines.append(f"\n{chr(9) * depth}{_prop(item, 'label', item.get('id'))}. {prose}")
+        for part in item.get("parts") or []:
+            _add_prose(part, depth)
+
+    if statement:
+        _add_prose(statement, -3)
+
+    return "".join(lines).strip()
+
+
+def _statement_v50(parts: list) -> list:
+    return [
+        {
+            "prose": {_prop(part, "label"): part["prose"]} if "prose" in part else None,
+            "parts": _statement_v50(part.get("parts") or []),
+        }
+        for part in parts
+    ]
+
+
+def _rows_v50(catalog: dict) -> list:
+    controls = sorted(
+        ((group["id"], control) for group in catalog["groups"] for control in group["controls"]),
+        key=lambda item: _prop(item[1], "sort-id", item[1]["title"]),
+    )
+    next_ids = {}
+    for (_, control), (_, next_control) in zip(controls, controls[1:]):
+        if next_control["id"] != control["id"]:
+            next_ids[control["id"]] = next_control["id"]
+
+    rows = []
+    for family, control in controls:
+        statement = _part(control, "statement")
+        rows.append(
+            {
+                "control_id": control["id"],
+                "family": family,
+                "description": _description_v50(statement),
+                "statement": _statement_v50(statement.get("parts") or []),
+                "implementation": _part(control, "implementation").get("prose", ""),
+                "guidance": _part(control, "guidance").get("prose", ""),
+                "next_id": next_ids.get(control["id"], ""),
+            }
+        )
+
+    return rows
+
+
+def _parse_control_content(catalog_file: str, version: str) -> tuple:
+    with open(catalog_file, "rb") as file:
+        document = json.load(file)
+
+    catalog = document.get("catalog", document)
+    rows = _rows_v31(catalog) if version == "CMS_ARS_3_1" else _rows_v50(catalog)
+
+    return catalog.get("metadata", {}).get("title", ""), rows
+
+
+def populate_control_content(apps, schema_editor):
+    """Render and store control content for catalogs that were ingested before these fields existed."""
+    Catalog = apps.get_model("catalogs", "Catalog")
+    Controls = apps.get_model("catalogs", "Controls")
+
+    for catalog in Catalog.objects.all():
+        if not catalog.file_name or not os.path.isfile(catalog.file_name.path):
+            logger.warning("Catalog file for %s is missing; control content was not populated.", catalog.name)
+            continue
+
+        title, rows = _parse_control_content(catalog.file_name.path, catalog.version)
+        content = {row["control_id"]: row for row in rows}
+
+        controls = list(Controls.objects.filter(catalog=catalog, control_id__in=content))
+        for control in controls:
+            for field in CONTENT_FIELDS:
+                setattr(control, field, content[control.control_id][field])
+
+        Controls.objects.bulk_update(controls, CONTENT_FIELDS, batch_size=500)
+        Catalog.objects.filter(pk=catalog.pk).update(title=title)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0008_alter_controls_control_label_alter_controls_sort_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='catalog',
+            name='title',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Title from the catalog metadata, populated when the catalog is ingested', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='controls',
+            name='description',
+            field=models.TextField(blank=True, default='', help_text='Rendered control statement prose.'),
+        ),
+        migrations.AddField(
+            model_name='controls',
+            name='family',
+            field=models.CharField(blank=True, default='', help_text='Control family, for example Access Control.', max_length=124),
+        ),
+        migrations.AddField(
+            model_name='controls',
+            name='guidance',
+            field=models.TextField(blank=True, default='', help_text='Control guidance.'),
+        ),
+        migrations.AddField(
+            model_name='controls',
+            name='implementation',
+            field=models.TextField(blank=True, default='', help_text='Control implementation standards.'),
+        ),
+        migrations.AddField(
+            model_name='controls',
+            name='next_id',
+            field=models.CharField(blank=True, default='', help_text='ID of the next control in catalog order, for example ac-2', max_length=12),
+        ),
+        migrations.AddField(
+            model_name='controls',
+            name='statement',
+            field=models.JSONField(blank=True, default=list, help_text='Nested control statement parts, keyed by part label.'),
+        ),
+        migrations.AddIndex(
+            model_name='controls',
+            index=models.Index(fields=['catalog', 'control_id'], name='catalogs_co_catalog_bad4f6_idx'),
+        ),
+        migrations.RunPython(populate_control_content, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.1 on 2026-10-18 08:28
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Index the controls of catalogs ingested before search vectors existed, as catalogs.ingest.index_control_text does.
+POPULATE_SEARCH_VECTOR = """
+UPDATE catalogs_controls SET search_vector =
+    setweight(to_tsvector('english', control_id || ' ' || title), 'A') ||
+    setweight(to_tsvector('english', statement), 'B') ||
+    setweight(to_tsvector('english', implementation || ' ' || guidance), 'C')
+"""
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0009_controls_content'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='controls',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text="Weighted text search vector of the control's id, title, statement, implementation and guidance.", null=True),
+        ),
+        migrations.AddIndex(
+            model_name='controls',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='catalogs_controls_search_idx'),
+        ),
+        migrations.RunSQL(POPULATE_SEARCH_VECTOR, migrations.RunSQL.noop),
+    ]
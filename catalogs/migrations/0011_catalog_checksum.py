@@ -0,0 +1,18 @@
+# Generated by Django 4.1.1 on 2026-10-18 08:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogs', '0010_controls_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='catalog',
+            name='checksum',
+            field=models.CharField(blank=True, default='', editable=False, help_text='SHA-256 of the catalog file whose controls are loaded, populated when the catalog is ingested', max_length=64),
+        ),
+    ]
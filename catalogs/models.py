@@ -1,23 +1,49 @@
 import json
-import jsonschema
 
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from jsonschema.exceptions import SchemaError, ValidationError
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+CATALOG_SCHEMA = Path(__file__).parent / "schemas" / "oscal_catalog_schema.json"
+
+# Postgres text search configuration used to index and query control text.
+SEARCH_CONFIG = "english"
+
+
+@lru_cache(maxsize=None)
+def get_catalog_validator() -> Validator:
+    """Load the OSCAL catalog schema and build a validator for it once per process."""
+    with open(CATALOG_SCHEMA, "r") as file:
+        oscal_schema = json.load(file)
+
+    validator_cls = validator_for(oscal_schema)
+    validator_cls.check_schema(oscal_schema)
+
+    return validator_cls(oscal_schema, format_checker=validator_cls.FORMAT_CHECKER)
 
 
 def validate_catalog(file_name):
     cat = json.load(file_name.file)
-    with open("catalogs/schemas/oscal_catalog_schema.json", "r") as file:
-        oscal_schema = json.load(file)
 
     try:
-        jsonschema.validate(instance=cat, schema=oscal_schema)
+        get_catalog_validator().validate(cat)
     except ValidationError as exc:
         raise ValidationError("The Catalog is not a valid OSCAL catalog.") from exc
     except SchemaError as exc:
         raise ValidationError("The Catalog schema is not a valid OSCAL catalog schema.") from exc
 
+    # Hand the parsed document on to control ingest so the file is not parsed again after it is saved.
+    if (instance := getattr(file_name, "instance", None)) is not None:
+        instance.parsed_document = cat
+
 
 class Catalog(models.Model):
     class ImpactLevel(models.TextChoices):
@@ -54,9 +80,29 @@ class Catalog(models.Model):
         default=ImpactLevel.MODERATE,
         help_text="FISMA impact level of the project",
     )
+    title = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Title from the catalog metadata, populated when the catalog is ingested",
+    )
+    checksum = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="SHA-256 of the catalog file whose controls are loaded, populated when the catalog is ingested",
+    )
     created = models.DateTimeField(auto_now_add=True, db_index=True)
     updated = models.DateTimeField(auto_now=True, db_index=True, null=True)
 
+    # Catalog document already parsed by validate_catalog; consumed by the add_controls signal.
+    parsed_document: Optional[dict] = None
+    # Catalog title, Controls field values and encoded snapshot (or None) computed before saving (load_catalog --jobs);
+    # consumed by add_controls.
+    prepared_content: Optional[Tuple[str, List[dict], Optional[bytes]]] = None
+
     def __str__(self):
         return self.name
 
@@ -82,6 +128,50 @@ class Controls(models.Model):
         max_length=124,
         help_text="Catalog control title, for example Access Control Policy and Procedures.",
     )
+    family = models.CharField(
+        max_length=124,
+        blank=True,
+        default="",
+        help_text="Control family, for example Access Control.",
+    )
+    description = models.TextField(blank=True, default="", help_text="Rendered control statement prose.")
+    statement = models.JSONField(
+        blank=True,
+        default=list,
+        help_text="Nested control statement parts, keyed by part label.",
+    )
+    implementation = models.TextField(blank=True, default="", help_text="Control implementation standards.")
+    guidance = models.TextField(blank=True, default="", help_text="Control guidance.")
+    next_id = models.CharField(
+        max_length=12,
+        blank=True,
+        default="",
+        help_text="ID of the next control in catalog order, for example ac-2",
+    )
+    search_vector = SearchVectorField(
+        null=True,
+        editable=False,
+        help_text="Weighted text search vector of the control's id, title, statement, implementation and guidance.",
+    )
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["catalog", "control_id"]),
+            GinIndex(fields=["search_vector"], name="catalogs_controls_search_idx"),
+        ]
 
     def __str__(self):
         return self.control_label
+
+    def to_summary(self) -> dict:
+        """Return the rendered catalog content stored for this control at ingest time."""
+        return {
+            "label": self.control_label,
+            "sort_id": self.sort_id,
+            "title": self.title,
+            "family": self.family,
+            "description": self.description,
+            "implementation": self.implementation,
+            "guidance": self.guidance,
+            "next_id": self.next_id,
+        }
@@ -0,0 +1,332 @@
+import abc
+import hashlib
+import json
+import sys
+import threading
+import weakref
+
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+from catalogs.catalogio import CatalogTools, control_sort_key, get_parameter_values
+from catalogs.io.stream import CatalogStream
+from catalogs.io.v5_0 import CatalogModel, Control
+from catalogs.models import Catalog
+
+ReaderT = TypeVar("ReaderT", bound="CatalogReader")
+
+readers: Dict[str, Type["CatalogReader"]] = {}
+
+# The Controls fields filled in from a catalog file.
+CONTROL_FIELDS = (
+    "control_id", "control_label", "sort_id", "title", "family", "description", "statement", "implementation",
+    "guidance", "next_id",
+)
+
+
+def register_reader(version: str) -> Callable[[Type[ReaderT]], Type[ReaderT]]:
+    """Class decorator registering the reader for catalogs of an ARS version."""
+    def _register(reader: Type[ReaderT]) -> Type[ReaderT]:
+        reader.version = version
+        readers[version] = reader
+        return reader
+
+    return _register
+
+
+def get_reader_class(version: str) -> Type["CatalogReader"]:
+    try:
+        return readers[version]
+    except KeyError as exc:
+        raise ValueError(f"No catalog reader is registered for version {version}.") from exc
+
+
+def load_reader(version: str, source: Union[str, Path, dict]) -> "CatalogReader":
+    """Read a catalog file, or an already parsed catalog document, of the given ARS version."""
+    reader = get_reader_class(version)
+    if isinstance(source, dict):
+        return reader.from_document(source)
+
+    return reader.from_file(source)
+
+
+# A slot per stored control field, instead of a dict per control.
+# pylint: disable-next=too-many-instance-attributes
+class ControlRecord:
+    """A rendered control.
+
+    Catalogs hold hundreds of controls, so they are slotted records rather than dicts, the ids, labels and family
+    names repeated across baselines and lookups are interned, and statements are kept as nested tuples that are only
+    turned back into dicts when asked for.
+    """
+    __slots__ = (
+        "control_id", "control_label", "sort_id", "title", "family", "description", "_statement", "implementation",
+        "guidance", "parameters", "search_text", "__weakref__",
+    )
+
+    def __init__(self, control: dict):
+        self.control_id = _intern(control["control_id"])
+        self.control_label = _intern(control["control_label"])
+        self.sort_id = _intern(control["sort_id"])
+        self.title = control["title"]
+        self.family = _intern(control["family"])
+        self.description = control["description"]
+        self._statement = _pack_statement(control["statement"])
+        self.implementation = control["implementation"]
+        self.guidance = control["guidance"]
+        self.parameters = control.get("parameters", {})
+        self.search_text = " ".join((self.control_id, self.title or "", self.description)).lower()
+
+    @property
+    def statement(self) -> List[dict]:
+        return _unpack_statement(self._statement)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _pack_statement(parts: List[dict]) -> tuple:
+    """Turn statement parts, {"prose": {label: text} or None, "parts": [...]}, into nested (prose items, parts)."""
+    return tuple(
+        (
+            None if (prose := part["prose"]) is None else tuple((_intern(key), text) for key, text in prose.items()),
+            _pack_statement(part["parts"]),
+        )
+        for part in parts
+    )
+
+
+def _unpack_statement(packed: tuple) -> List[dict]:
+    return [
+        {"prose": dict(prose) if prose is not None else None, "parts": _unpack_statement(parts)}
+        for prose, parts in packed
+    ]
+
+
+class ControlStore:
+    """The control records of one ARS version, shared by the readers of its low, moderate and high baselines.
+
+    Baselines repeat most of their controls word for word; controls whose rendered content is identical (including
+    parameter values, which can differ by baseline) are held once. Entries are dropped when no reader uses them.
+    """
+
+    def __init__(self):
+        self._controls: "weakref.WeakValueDictionary[Tuple[str, bytes], ControlRecord]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(control: dict) -> Tuple[str, bytes]:
+        content = json.dumps(control, sort_keys=True).encode()
+        return control["control_id"], hashlib.blake2b(content, digest_size=16).digest()
+
+    def intern(self, control: dict) -> ControlRecord:
+        """Return the stored record of a control with the same content, storing a new one if there is none."""
+        key = self._key(control)
+        with self._lock:
+            if (record := self._controls.get(key)) is None:
+                record = self._controls[key] = ControlRecord(control)
+
+        return record
+
+    def __len__(self) -> int:
+        return len(self._controls)
+
+
+control_stores: Dict[str, ControlStore] = {}
+
+
+class CatalogReader(abc.ABC):
+    """Version independent access to the controls of a catalog.
+
+    Each ARS version has a subclass, registered with ``register_reader``, that renders its controls into the fields
+    stored on ``Controls``. Everything else is indexed here once, when the catalog is read.
+    """
+    version: str = ""
+
+    def __init__(self, title: str, controls: List[dict], next_ids: Dict[str, str]):
+        self.title = title
+        store = control_stores.setdefault(self.version, ControlStore())
+        self._controls = controls = [store.intern(control) for control in controls]
+        self._controls_by_id: Dict[str, ControlRecord] = {}
+        for control in controls:
+            self._controls_by_id.setdefault(control.control_id, control)
+
+        self._next_ids = next_ids
+        self._previous_ids = {next_id: control_id for control_id, next_id in next_ids.items()}
+        self._search_text = {control_id: control.search_text for control_id, control in self._controls_by_id.items()}
+
+    @classmethod
+    @abc.abstractmethod
+    def from_document(cls: Type[ReaderT], document: dict) -> ReaderT:
+        """Read an already parsed catalog document."""
+
+    @classmethod
+    def from_file(cls: Type[ReaderT], path: Union[str, Path]) -> ReaderT:
+        with open(path, "rb") as file:
+            return cls.from_document(json.load(file))
+
+    @staticmethod
+    @abc.abstractmethod
+    def stream_rows(stream: CatalogStream, order: List[Tuple]) -> Iterator[dict]:
+        """Yield the Controls rows of a catalog stream, adding (sort key, id) to order for each id in the next order."""
+
+    def control_ids(self) -> List[str]:
+        """Ids of every control and enhancement, in catalog order."""
+        return list(self._controls_by_id)
+
+    def control_rows(self) -> List[dict]:
+        """The Controls field values for every control, in catalog order."""
+        return [
+            {
+                **{field: getattr(control, field) for field in CONTROL_FIELDS[:-1]},
+                "next_id": self.get_next(control.control_id),
+            }
+            for control in self._controls
+        ]
+
+    def get_control(self, control_id: str) -> Optional[ControlRecord]:
+        return self._controls_by_id.get(control_id)
+
+    def control_summary(self, control_id: str) -> dict:
+        """The rendered content of a control, shaped like Controls.to_summary.
+
+        The family is the stored one (its title in ARS 3.1, its id in 5.0), as used by the ``family`` filter. Ids that
+        are not in the catalog get None for their title, family and description and empty values for the rest.
+        """
+        if (control := self._controls_by_id.get(control_id)) is None:
+            return {
+                "label": "", "sort_id": "", "title": None, "family": None, "description": None, "implementation": "",
+                "guidance": "", "next_id": "",
+            }
+
+        return {
+            "label": control.control_label,
+            "sort_id": control.sort_id,
+            "title": control.title,
+            "family": control.family,
+            "description": control.description,
+            "implementation": control.implementation,
+            "guidance": control.guidance,
+            "next_id": self.get_next(control_id),
+        }
+
+    def get_next(self, control_id: str) -> str:
+        return self._next_ids.get(control_id, "")
+
+    def get_previous(self, control_id: str) -> str:
+        return self._previous_ids.get(control_id, "")
+
+    def get_family(self, control_id: str) -> str:
+        control = self._controls_by_id.get(control_id)
+        return control.family if control else ""
+
+    def get_statement(self, control_id: str) -> List[dict]:
+        control = self._controls_by_id.get(control_id)
+        return control.statement if control else []
+
+    def get_parameters(self, control_id: str) -> dict:
+        control = self._controls_by_id.get(control_id)
+        return control.parameters if control else {}
+
+    def search(self, text: str) -> List[str]:
+        """Ids of the controls whose id, title or description contains text, ignoring case."""
+        text = text.lower()
+        return [control_id for control_id, haystack in self._search_text.items() if text in haystack]
+
+
+def next_ids_in_order(order: List[Tuple]) -> Dict[str, str]:
+    """Map each control id to the next distinct id in sort order."""
+    ids = [control_id for _, control_id in sorted(order, key=lambda item: item[0])]
+
+    return {control_id: next_id for control_id, next_id in zip(ids, ids[1:]) if next_id != control_id}
+
+
+@register_reader(Catalog.Version.CMS_ARS_3_1)
+class CatalogReaderV31(CatalogReader):
+    """ARS 3.1 catalogs, read with CatalogTools.
+
+    Families are group titles. Enhancements are nested in their controls and only top level controls have a next
+    control, ordered by family and number.
+    """
+    _tools = CatalogTools({"catalog": {}})  # Only used to render individual controls.
+
+    @classmethod
+    def _render(cls, control: dict, family: str) -> dict:
+        content = cls._tools.get_control_content(control)
+
+        return {
+            "control_id": control["id"],
+            "control_label": content["label"],
+            "sort_id": content["sort_id"],
+            "title": content["title"],
+            "family": family or "",
+            "description": content["description"] or "",
+            "statement": cls._tools.get_control_statement(control),
+            "implementation": content["implementation"] or "",
+            "guidance": content["guidance"] or "",
+        }
+
+    @classmethod
+    def from_document(cls, document: dict) -> "CatalogReaderV31":
+        return cls.from_tools(CatalogTools(document))
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "CatalogReaderV31":
+        return cls.from_tools(CatalogTools(path))
+
+    @classmethod
+    def from_tools(cls, tools: CatalogTools) -> "CatalogReaderV31":
+        controls = [
+            {
+                **cls._render(control, tools.get_group_title_by_id(tools.get_group_id_by_control_id(control["id"]))),
+                "parameters": tools.get_control_parameters(control),
+            }
+            for control in tools.get_controls_all()
+        ]
+        order = [(control_sort_key(control_id), control_id) for control_id in tools.get_control_ids()]
+
+        return cls(tools.catalog_title, controls, next_ids_in_order(order))
+
+    @staticmethod
+    def stream_rows(stream: CatalogStream, order: List[Tuple]) -> Iterator[dict]:
+        for group, control in stream.controls():
+            order.append((control_sort_key(control["id"]), control["id"]))
+
+            for item in (control, *control.get("controls", [])):
+                yield CatalogReaderV31._render(item, group.get("title"))
+
+
+@register_reader(Catalog.Version.CMS_ARS_5_0)
+class CatalogReaderV50(CatalogReader):
+    """ARS 5.0 catalogs, read with CatalogModel.
+
+    Families are group ids, whose titles are only used in control summaries. Enhancements are listed alongside their
+    controls and every control has a next control, ordered by sort id.
+    """
+
+    @classmethod
+    def from_document(cls, document: dict) -> "CatalogReaderV50":
+        return cls.from_model(CatalogModel.from_document(document))
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "CatalogReaderV50":
+        return cls.from_model(CatalogModel.from_json(path))
+
+    @classmethod
+    def from_model(cls, catalog: CatalogModel) -> "CatalogReaderV50":
+        controls = [
+            {**control.to_orm(), "parameters": get_parameter_values(control.params or [])}
+            for control in catalog.controls
+        ]
+        next_ids = {control["control_id"]: catalog.get_next(item) for control, item in zip(controls, catalog.controls)}
+
+        return cls(catalog.metadata.title, controls, {key: value for key, value in next_ids.items() if value})
+
+    @staticmethod
+    def stream_rows(stream: CatalogStream, order: List[Tuple]) -> Iterator[dict]:
+        for group, control_data in stream.controls():
+            control = Control(**control_data, family_id=group.get("id", ""))
+            order.append((control.sort_id, control.id))
+
+            yield control.to_orm()
@@ -0,0 +1,99 @@
+import logging
+import os
+
+from typing import Callable, Iterable, Optional, Union
+
+from django.conf import settings
+
+from blueprintapi.cache import LRUCache
+from catalogs.catalogio import CatalogTools
+from catalogs.io.v5_0 import CatalogModel
+from catalogs.models import Catalog
+from catalogs.readers import CatalogReader, load_reader
+
+logger = logging.getLogger(__name__)
+
+ParsedCatalog = Union[CatalogTools, CatalogModel, CatalogReader]
+
+
+class CatalogRegistry:
+    """Process-wide cache of parsed catalogs.
+
+    Entries are keyed by ``Catalog.pk``, the parser used, and a stamp made of the catalog file's mtime and
+    ``Catalog.updated``, so a re-uploaded or edited catalog is re-parsed on its next use even in processes that did not
+    receive the save signal.
+    """
+    TOOLS = "tools"
+    MODEL = "model"
+    READER = "reader"
+
+    loaders: dict[str, Callable[[Catalog], ParsedCatalog]] = {
+        TOOLS: lambda catalog: CatalogTools(catalog.file_name.path),
+        MODEL: lambda catalog: CatalogModel.from_json(catalog.file_name.path),
+        READER: lambda catalog: load_reader(catalog.version, catalog.file_name.path),
+    }
+
+    def __init__(self, maxsize: int):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    @staticmethod
+    def _stamp(catalog: Catalog) -> tuple:
+        try:
+            mtime: Optional[float] = os.path.getmtime(catalog.file_name.path)
+        except (OSError, ValueError):
+            mtime = None
+
+        return mtime, catalog.updated
+
+    def get(self, catalog: Catalog, loader: str = TOOLS) -> ParsedCatalog:
+        """Return the parsed catalog, loading it with the named loader on a cache miss."""
+        key = (catalog.pk, loader, *self._stamp(catalog))
+
+        def _load() -> ParsedCatalog:
+            # Drop entries parsed from an older revision of the same catalog before storing the new one.
+            self._cache.evict(lambda key_: key_[:2] == key[:2])
+            logger.info("Parsing catalog %s into the catalog registry.", catalog)
+            return self.loaders[loader](catalog)
+
+        return self._cache.get_or_set(key, _load)
+
+    def preload(self, loaders: Iterable[str] = (READER, TOOLS)) -> int:
+        """Parse every catalog with each of the given loaders, returning the number of catalogs loaded.
+
+        Readers serve the control lookups and CatalogTools the raw control trees. CatalogTools render their controls
+        lazily; preloaded ones render them all here, before the caller freezes them.
+        """
+        count = 0
+        for catalog in Catalog.objects.order_by("pk"):
+            try:
+                for loader in loaders:
+                    if isinstance(parsed := self.get(catalog, loader), CatalogTools):
+                        parsed.render_controls()
+            except (OSError, ValueError) as exc:  # Including CatalogLoadError and pydantic's ValidationError.
+                logger.warning("Could not preload catalog %s: %s", catalog, exc)
+                continue
+
+            count += 1
+
+        return count
+
+    def invalidate(self, catalog_pk: int) -> int:
+        """Remove every parsed revision of a catalog."""
+        return self._cache.evict(lambda key: key[0] == catalog_pk)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+catalog_registry = CatalogRegistry(maxsize=getattr(settings, "CATALOG_CACHE_SIZE", 12))
+
+
+def get_catalog_tools(catalog: Catalog) -> CatalogTools:
+    return catalog_registry.get(catalog, CatalogRegistry.TOOLS)
+
+
+def get_catalog_reader(catalog: Catalog) -> CatalogReader:
+    return catalog_registry.get(catalog, CatalogRegistry.READER)
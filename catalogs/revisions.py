@@ -0,0 +1,81 @@
+import logging
+
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+from django.db import transaction
+from django.dispatch import Signal
+
+from blueprintapi.db import bulk_insert
+from catalogs.ingest import build_snapshot, file_checksum, index_control_text, parse_control_content
+from catalogs.models import Catalog, Controls
+from catalogs.readers import CONTROL_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Sent inside the revision's transaction with the pks of the Controls that were added and of those about to be removed,
+# so rows that reference them can follow.
+controls_revised = Signal()
+
+
+class ControlsRevision(NamedTuple):
+    unchanged: bool = False
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+
+
+def update_controls(instance: Catalog) -> ControlsRevision:
+    """Bring a Catalog's Controls in line with its current file, which has replaced the one they were loaded from.
+
+    A file with the same checksum is skipped. Otherwise controls are matched by id: changed rows are updated in bulk,
+    new ones inserted and missing ones deleted, keeping the pks (and so the project controls) of every control that is
+    still in the catalog.
+    """
+    document, instance.parsed_document = instance.parsed_document, None
+    path = instance.file_name.path
+
+    checksum = file_checksum(path)
+    if checksum == instance.checksum:
+        logger.info("Catalog %s file is unchanged; controls were not updated.", instance)
+        build_snapshot(path, document)  # The replaced file's snapshot was deleted with it.
+        return ControlsRevision(unchanged=True)
+
+    title, rows = parse_control_content(path, instance.version, document=document)
+
+    with transaction.atomic():
+        existing: Dict[str, List[Controls]] = defaultdict(list)
+        for control in Controls.objects.filter(catalog=instance).order_by("pk"):
+            existing[control.control_id].append(control)
+        existing_pks = [control.pk for controls in existing.values() for control in controls]
+
+        changed, added = [], []
+        for row in rows:
+            if not existing[row["control_id"]]:  # Repeated ids (e.g. ac-6.9 in ARS 5.0) are matched in order.
+                added.append(row)
+                continue
+
+            control = existing[row["control_id"]].pop(0)
+            if any(getattr(control, field) != row[field] for field in CONTROL_FIELDS):
+                for field in CONTROL_FIELDS:
+                    setattr(control, field, row[field])
+                changed.append(control)
+
+        removed_pks = [control.pk for controls in existing.values() for control in controls]
+
+        Controls.objects.bulk_update(changed, CONTROL_FIELDS, batch_size=500)
+        bulk_insert(Controls, (Controls(catalog=instance, **row) for row in added))
+        added_pks = list(
+            Controls.objects.filter(catalog=instance).exclude(pk__in=existing_pks).values_list("pk", flat=True)
+        )
+
+        controls_revised.send(sender=Catalog, catalog=instance, added=added_pks, removed=removed_pks)
+        Controls.objects.filter(pk__in=removed_pks).delete()
+
+        index_control_text(instance)
+        instance.title, instance.checksum = title, checksum
+        Catalog.objects.filter(pk=instance.pk).update(title=title, checksum=checksum)
+
+    build_snapshot(path, document)
+
+    return ControlsRevision(added=len(added_pks), changed=len(changed), removed=len(removed_pks))
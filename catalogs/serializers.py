@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
+from blueprintapi.serializers import SparseFieldsetMixin
+
 from .models import Catalog, Controls
 
 
-class CatalogListSerializer(serializers.ModelSerializer):
+class CatalogListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Catalog
         fields = (
@@ -16,7 +18,40 @@ class CatalogListSerializer(serializers.ModelSerializer):
         )
 
 
-class ControlSerializer(serializers.ModelSerializer):
+class ControlSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Controls
-        fields = "__all__"
+        fields = ("id", "catalog", "control_id", "control_label", "sort_id", "title")
+
+
+class ControlListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """Rendered control content."""
+    id = serializers.CharField(source="control_id")
+    label = serializers.CharField(source="control_label")
+
+    class Meta:
+        model = Controls
+        fields = (
+            "id",
+            "label",
+            "sort_id",
+            "title",
+            "family",
+            "description",
+            "implementation",
+            "guidance",
+            "next_id",
+        )
+
+
+class ControlSearchSerializer(ControlListSerializer):
+    """A control matching a search, with its rank and highlighted matches."""
+    rank = serializers.FloatField()
+    headline = serializers.CharField()
+
+    class Meta(ControlListSerializer.Meta):
+        fields = ("id", "label", "title", "family", "rank", "headline")
+
+
+class ControlBatchSerializer(serializers.Serializer):  # pylint: disable=abstract-method
+    ids = serializers.ListField(child=serializers.CharField(), allow_empty=False, max_length=500)
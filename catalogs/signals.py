@@ -1,37 +1,28 @@
 import os
 
-from typing import List
+from django.db import transaction
 
-from catalogs.catalogio import CatalogTools
-from catalogs.io.v5_0 import CatalogModel
-from catalogs.models import Catalog, Controls
+from catalogs.ingest import file_checksum, ingest_controls
+from catalogs.io.snapshot import delete_snapshot
+from catalogs.models import Catalog
+from catalogs.registry import catalog_registry
+from catalogs.revisions import update_controls
 
 
 # noinspection PyUnusedLocal
 def add_controls(sender, instance: Catalog, created: bool, **kwargs):  # pylint: disable=unused-argument
+    """Load the controls of a new Catalog, or revise them in place when a saved Catalog's file was replaced."""
     if created:
-        if instance.version == Catalog.Version.CMS_ARS_3_1:
-            catalog = CatalogTools(instance.file_name.path)
-            control_ids = catalog.get_controls_all_ids()
-            if control_ids:
-                control_objects: List = []
-                for control_id in control_ids:
-                    control_data = catalog.get_control_data_simplified(control_id)
-                    control_objects.append(
-                        Controls(
-                            catalog=instance,
-                            control_id=control_id,
-                            control_label=control_data.get("label"),
-                            sort_id=control_data.get("sort_id"),
-                            title=control_data.get("title"),
-                        )
-                    )
-                Controls.objects.bulk_create(control_objects)
-        else:
-            catalog_data = CatalogModel.from_json(instance.file_name.path)
-            Controls.objects.bulk_create(
-                [Controls(**{"catalog": instance, **item.to_orm()}) for item in catalog_data.controls]
-            )
+        instance.title = ingest_controls(instance)
+        Catalog.objects.filter(pk=instance.pk).update(title=instance.title, checksum=instance.checksum)
+    elif file_checksum(instance.file_name.path) != instance.checksum:
+        update_controls(instance)
+
+
+# noinspection PyUnusedLocal
+def invalidate_catalog_cache(sender, instance: Catalog, **kwargs):  # pylint: disable=unused-argument
+    """Drop any parsed copies of a saved or deleted Catalog from this process's catalog registry."""
+    catalog_registry.invalidate(instance.pk)
 
 
 # noinspection PyUnusedLocal
@@ -40,11 +31,15 @@ def auto_delete_file_on_delete(sender, instance: Catalog, **kwargs):  # pylint:
     if instance.file_name:
         if os.path.isfile(instance.file_name.path):
             os.remove(instance.file_name.path)
+        delete_snapshot(instance.file_name.path)
 
 
 # noinspection PyUnusedLocal
 def auto_delete_file_on_change(sender, instance: Catalog, **kwargs):  # pylint: disable=unused-argument
-    """Delete old file from filesystem when Catalog object is update with a new file."""
+    """Delete old file from filesystem when Catalog object is update with a new file.
+
+    The file is only deleted once the save is committed, so a rolled back save still has its file.
+    """
     if not instance.pk:
         return False
 
@@ -55,5 +50,10 @@ def auto_delete_file_on_change(sender, instance: Catalog, **kwargs):  # pylint:
 
     new_file = instance.file_name
     if not old_file == new_file:
-        if os.path.isfile(old_file.path):
-            os.remove(old_file.path)
+        transaction.on_commit(lambda: _delete_file(old_file.path))
+
+
+def _delete_file(path: str):
+    if os.path.isfile(path):
+        os.remove(path)
+    delete_snapshot(path)
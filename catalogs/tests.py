@@ -1,13 +1,28 @@
+import json
+import os
+
+from io import StringIO
+from pathlib import Path
+
+from django.conf import settings
 from django.core.files import File
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.core.management import call_command
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 
 from testing_utils import AuthenticatedAPITestCase, prevent_request_warnings
 
+from blueprintapi.cache import LRUCache
+from blueprintapi.db import bulk_insert, copy_value
 from catalogs.catalogio import CatalogTools as Tools
-from catalogs.models import Catalog, Controls
+from catalogs.io.snapshot import read_snapshot, snapshot_path
+from catalogs.io.v5_0 import CatalogModel
+from catalogs.forms import CatalogAdminForm
+from catalogs.ingest import parse_control_content
+from catalogs.models import Catalog, Controls, get_catalog_validator
+from catalogs.registry import CatalogRegistry, catalog_registry, get_catalog_reader, get_catalog_tools
 
 
 class CatalogModelTest(AuthenticatedAPITestCase):
@@ -37,6 +52,27 @@ class CatalogModelTest(AuthenticatedAPITestCase):
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_get_control_by_id_returns_statement(self):
+        response = self.client.get(
+            reverse("get_control_by_id", kwargs={"catalog": self.cat.id, "control_id": "ac-2"})
+        )
+        catalog = Tools(self.cat.file_name.path)
+
+        self.assertEqual(
+            response.json()["description"], catalog.get_control_statement(catalog.get_control_by_id("ac-2"))
+        )
+
+    def test_ingest_stores_control_content(self):
+        control = Controls.objects.get(catalog=self.cat, control_id="ac-2")
+        catalog = Tools(self.cat.file_name.path)
+        expected = catalog.get_control_data_simplified("ac-2")
+
+        self.cat.refresh_from_db()
+        self.assertEqual(self.cat.title, "NIST SP 800-53 Rev 5 Controls Test Catalog")
+        for field, value in control.to_summary().items():
+            with self.subTest(field=field):
+                self.assertEqual(value, expected[field] or "")
+
     @prevent_request_warnings
     def test_post_control_by_id(self):
         cid = self.cat.id
@@ -46,6 +82,157 @@ class CatalogModelTest(AuthenticatedAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
 
 
+class CatalogControlsViewTestCase(AuthenticatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with open("blueprintapi/testdata/NIST_SP-800-53_rev5_test.json", "rb") as file:
+            cls.cat = Catalog.objects.create(name="NIST Test Catalog", file_name=File(file))
+        cls.url = reverse("get_all_controls", kwargs={"catalog": cls.cat.id})
+
+    def test_raw_controls_by_default(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual(response.json()["controls"], Tools(self.cat.file_name.path).get_controls_all())
+
+    def test_paginated_projection(self):
+        response = self.client.get(self.url, {"page_size": 5, "fields": "id,title"})
+        content = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(content["count"], Controls.objects.filter(catalog=self.cat).count())
+        self.assertEqual(len(content["results"]), 5)
+        self.assertSetEqual(set(content["results"][0]), {"id", "title"})
+        self.assertIsNotNone(content["next"])
+
+    def test_filters(self):
+        response = self.client.get(self.url, {"id": "ac-1,ac-2", "fields": "id"})
+        self.assertListEqual(response.json()["results"], [{"id": "ac-1"}, {"id": "ac-2"}])
+
+        family = Controls.objects.get(catalog=self.cat, control_id="ac-1").family
+        response = self.client.get(self.url, {"family": family.upper()})
+        self.assertEqual(
+            response.json()["count"], Controls.objects.filter(catalog=self.cat, family=family).count()
+        )
+
+    @prevent_request_warnings
+    def test_unknown_field(self):
+        response = self.client.get(self.url, {"fields": "id,prose"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_conditional_get(self):
+        etag = self.client.get(self.url, {"fields": "id"})["ETag"]
+
+        response = self.client.get(self.url, {"fields": "id"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(self.url, {"fields": "title"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.cat.save()
+        response = self.client.get(self.url, {"fields": "id"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_public_cache_headers(self):
+        urls = [
+            reverse("catalog-list"),
+            self.url,
+            reverse("get_control_by_id", kwargs={"catalog": self.cat.id, "control_id": "ac-1"}),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertIn("public", response["Cache-Control"])
+                self.assertEqual(
+                    self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code,
+                    status.HTTP_304_NOT_MODIFIED,
+                )
+                self.assertEqual(
+                    self.client.get(url, {"fields": "id"}, HTTP_IF_NONE_MATCH=response["ETag"]).status_code,
+                    status.HTTP_200_OK,
+                )
+
+    def test_if_modified_since(self):
+        response = self.client.get(self.url)
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class CatalogControlsBatchViewTestCase(AuthenticatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with open("blueprintapi/testdata/NIST_SP-800-53_rev5_test.json", "rb") as file:
+            cls.cat = Catalog.objects.create(name="NIST Test Catalog", file_name=File(file))
+        cls.url = reverse("get_controls_batch", kwargs={"catalog": cls.cat.id})
+
+    def test_batch(self):
+        response = self.client.post(self.url, {"ids": ["ac-1", "ac-2", "zz-1", "not-a-control-id"]}, format="json")
+        content = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertListEqual(list(content["controls"]), ["ac-1", "ac-2"])
+        self.assertListEqual(content["missing"], ["zz-1", "not-a-control-id"])
+        self.assertDictEqual(
+            content["controls"]["ac-2"], Controls.objects.get(catalog=self.cat, control_id="ac-2").to_summary()
+        )
+
+    def test_batch_matches_stored_ars_50_controls(self):
+        with open("catalogs/data/5.0/cms_ars_50_low.json", "rb") as file:
+            catalog = Catalog.objects.create(
+                name="ARS 5.0 Low", file_name=File(file), version=Catalog.Version.CMS_ARS_5_0
+            )
+        url = reverse("get_controls_batch", kwargs={"catalog": catalog.id})
+
+        content = self.client.post(url, {"ids": ["ac-2"]}, format="json").json()
+        control = Controls.objects.get(catalog=catalog, control_id="ac-2")
+        self.assertEqual(content["controls"]["ac-2"]["family"], "ac")
+        self.assertDictEqual(content["controls"]["ac-2"], control.to_summary())
+
+    @prevent_request_warnings
+    def test_invalid_batch(self):
+        for data in ({}, {"ids": []}, {"ids": ["ac-1"] * 501}):
+            with self.subTest(data=data):
+                response = self.client.post(self.url, data, format="json")
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class CatalogSearchViewTestCase(AuthenticatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with open("blueprintapi/testdata/NIST_SP-800-53_rev5_test.json", "rb") as file:
+            cls.cat = Catalog.objects.create(name="NIST Test Catalog", file_name=File(file))
+        cls.url = reverse("search_controls", kwargs={"catalog": cls.cat.id})
+
+    def test_ingest_indexes_controls(self):
+        self.assertFalse(Controls.objects.filter(catalog=self.cat, search_vector__isnull=True).exists())
+
+    def test_search(self):
+        response = self.client.get(self.url, {"q": "account management"})
+        results = response.json()["results"]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(results[0]["id"], "ac-2")
+        self.assertSetEqual(set(results[0]), {"id", "label", "title", "family", "rank", "headline"})
+        ranks = [item["rank"] for item in results]
+        self.assertListEqual(ranks, sorted(ranks, reverse=True))
+
+    def test_search_phrase_is_highlighted(self):
+        results = self.client.get(self.url, {"q": '"multi-factor"'}).json()["results"]
+
+        self.assertTrue(results)
+        self.assertTrue(any("<b>" in item["headline"] for item in results))
+
+    def test_no_matches(self):
+        response = self.client.get(self.url, {"q": "xylophone"})
+        self.assertEqual(response.json()["count"], 0)
+
+    @prevent_request_warnings
+    def test_query_is_required(self):
+        response = self.client.get(self.url, {"q": " "})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 class LoadCatalogCommandTestCase(TestCase):
     def test_load_standard_catalogs(self):
         test_cases = [
@@ -70,6 +257,7 @@ class LoadCatalogCommandTestCase(TestCase):
         catalog_qs = Catalog.objects.order_by("name").values("name", "impact_level", "version")
         self.assertEqual(catalog_qs.count(), 6)
         self.assertEqual(Controls.objects.count(), 1882)
+        self.assertFalse(Controls.objects.filter(description="").exists())
 
         for expected, actual in zip(test_cases, catalog_qs):
             with self.subTest(catalog=expected["name"]):
@@ -80,3 +268,240 @@ class LoadCatalogCommandTestCase(TestCase):
         call_command("load_catalog", load_standard_catalogs=True)
 
         self.assertEqual(Catalog.objects.count(), 6)
+
+    def test_load_standard_catalogs_in_parallel(self):
+        out = StringIO()
+        call_command("load_catalog", load_standard_catalogs=True, jobs=2, stdout=out)
+
+        self.assertEqual(Catalog.objects.count(), 6)
+        self.assertEqual(Controls.objects.count(), 1882)
+        self.assertFalse(Catalog.objects.filter(title="").exists())
+        self.assertEqual(Controls.objects.get(catalog__name="CMS_ARS_3_1_LOW", control_id="ac-1").next_id, "ac-2")
+        self.assertIn("CMS_ARS_5_0_HIGH: parsed in", out.getvalue())
+
+        catalog = Catalog.objects.get(name="CMS_ARS_5_0_HIGH")
+        with open(catalog.file_name.path, "rb") as file:
+            self.assertDictEqual(read_snapshot(catalog.file_name.path), json.load(file))
+
+
+class CatalogRegistryTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with open("blueprintapi/testdata/NIST_SP-800-53_rev5_test.json", "rb") as file:
+            cls.cat = Catalog.objects.create(name="NIST Test Catalog", file_name=File(file))
+
+    def setUp(self):
+        catalog_registry.clear()
+
+    def test_parsed_catalog_is_reused(self):
+        first = get_catalog_tools(self.cat)
+        second = get_catalog_tools(self.cat)
+
+        self.assertIs(first, second)
+        self.assertDictEqual(catalog_registry.stats(), {"hits": 1, "misses": 1, "size": 1, "maxsize": 18})
+
+    def test_loaders_are_cached_separately(self):
+        with open("catalogs/data/5.0/cms_ars_50_low.json", "rb") as file:
+            cat = Catalog.objects.create(
+                name="CMS_ARS_5_0_LOW", file_name=File(file), version=Catalog.Version.CMS_ARS_5_0, impact_level="low"
+            )
+
+        tools = catalog_registry.get(cat, CatalogRegistry.TOOLS)
+        model = catalog_registry.get(cat, CatalogRegistry.MODEL)
+
+        self.assertIsInstance(tools, Tools)
+        self.assertIsInstance(model, CatalogModel)
+        self.assertEqual(catalog_registry.stats()["size"], 2)
+
+    def test_saving_catalog_invalidates_entry(self):
+        first = get_catalog_tools(self.cat)
+
+        self.cat.source = "https://example.com/catalog.json"
+        self.cat.save()
+
+        self.assertEqual(catalog_registry.stats()["size"], 0)
+        self.assertIsNot(first, get_catalog_tools(self.cat))
+
+    def test_changed_updated_stamp_reloads(self):
+        first = get_catalog_tools(self.cat)
+
+        # Another process saved the catalog; this process only sees the new timestamp.
+        stale = Catalog.objects.get(pk=self.cat.pk)
+        Catalog.objects.filter(pk=self.cat.pk).update(source="https://example.com/catalog.json")
+        stale.updated = stale.updated.replace(year=stale.updated.year + 1)
+
+        self.assertIsNot(first, get_catalog_tools(stale))
+        self.assertEqual(catalog_registry.stats()["size"], 1)
+
+    def test_preload(self):
+        with open("catalogs/data/5.0/cms_ars_50_low.json", "rb") as file:
+            missing = Catalog.objects.create(
+                name="Missing file", file_name=File(file), version=Catalog.Version.CMS_ARS_5_0
+            )
+        os.remove(missing.file_name.path)
+
+        with self.assertLogs("catalogs.registry", level="WARNING"):
+            self.assertEqual(catalog_registry.preload(), 1)
+
+        get_catalog_reader(self.cat)
+        get_catalog_tools(self.cat)
+        self.assertEqual(catalog_registry.stats()["hits"], 2)
+
+    def test_preload_renders_tools(self):
+        catalog_registry.preload()
+
+        self.assertGreater(Tools(self.cat.file_name.path).render_controls(), 0)
+        self.assertEqual(get_catalog_tools(self.cat).render_controls(), 0)
+
+    def test_memory_report(self):
+        out = StringIO()
+        call_command("catalog_memory_report", stdout=out)
+
+        self.assertRegex(out.getvalue(), r"NIST Test Catalog +[\d.]+ ms +[\d.]+ MiB")
+
+    def test_benchmark_catalog_memory(self):
+        out = StringIO()
+        call_command("benchmark_catalog_memory", stdout=out)
+
+        for form in ("dict", "pydantic", "compact"):
+            self.assertRegex(out.getvalue(), rf"{form} +[\d.]+ MiB +[\d.]+ MiB")
+
+
+class LRUCacheTestCase(SimpleTestCase):
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+
+
+class CatalogUploadTestCase(TestCase):
+    def test_validator_is_reused(self):
+        self.assertIs(get_catalog_validator(), get_catalog_validator())
+
+    def test_upload_ingests_validated_document(self):
+        with open("blueprintapi/testdata/NIST_SP-800-53_rev5_test.json", "rb") as file:
+            upload = SimpleUploadedFile("NIST_SP-800-53_rev5_test.json", file.read())
+
+        form = CatalogAdminForm(
+            data={
+                "name": "Uploaded Catalog",
+                "source": "https://example.com/catalog.json",
+                "version": Catalog.Version.CMS_ARS_3_1,
+                "impact_level": Catalog.ImpactLevel.LOW,
+            },
+            files={"file_name": upload},
+        )
+        self.assertTrue(form.is_valid(), form.errors)
+
+        catalog = form.save()
+
+        self.assertIsNone(catalog.parsed_document)
+        self.assertEqual(Controls.objects.filter(catalog=catalog).count(), 53)
+        self.assertEqual(catalog.title, "NIST SP 800-53 Rev 5 Controls Test Catalog")
+
+
+class StreamingIngestTestCase(TestCase):
+    @override_settings(CATALOG_STREAMING_THRESHOLD=0)
+    def test_streamed_controls_match_full_parse(self):
+        test_cases = (
+            ("catalogs/data/3.1/CMS_ARS_3_1_HIGH-baseline_catalog.json", Catalog.Version.CMS_ARS_3_1),
+            ("catalogs/data/5.0/cms_ars_50_high.json", Catalog.Version.CMS_ARS_5_0),
+        )
+        fields = ("control_id", "control_label", "sort_id", "title", "family", "description", "statement",
+                  "implementation", "guidance", "next_id")
+
+        for path, version in test_cases:
+            with self.subTest(version=version):
+                with open(path, "rb") as file:
+                    catalog = Catalog.objects.create(
+                        name=version, file_name=File(file), version=version, impact_level=Catalog.ImpactLevel.HIGH
+                    )
+
+                title, rows = parse_control_content(path, version)
+                streamed = Controls.objects.filter(catalog=catalog).order_by("pk").values(*fields)
+
+                self.assertEqual(Catalog.objects.get(pk=catalog.pk).title, title)
+                self.assertListEqual(list(streamed), [{field: row[field] for field in fields} for row in rows])
+
+
+class BulkInsertTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        with open("blueprintapi/testdata/NIST_SP-800-53_rev5_test.json", "rb") as file:
+            cls.cat = Catalog.objects.create(name="NIST Test Catalog", file_name=File(file))
+
+    def test_copied_rows_round_trip(self):
+        row = {
+            "control_id": "zz-1",
+            "control_label": "ZZ-1",
+            "sort_id": "zz-01",
+            "title": "Tabs\tnew\nlines, back\\slashes and \"quotes\"",
+            "statement": [{"prose": {"a.": "Line one\nline\\two\t\\N"}, "parts": [None, 1.5, True]}],
+        }
+        inserted = bulk_insert(Controls, [Controls(catalog=self.cat, **row)])
+
+        self.assertEqual(inserted, 1)
+        self.assertDictEqual(
+            Controls.objects.filter(catalog=self.cat, control_id="zz-1").values(*row).get(), row
+        )
+
+    def test_copy_value(self):
+        self.assertEqual(copy_value(None), r"\N")
+        self.assertEqual(copy_value(True), "t")
+        self.assertEqual(copy_value([1, None, 'a"b']), r'{"1",NULL,"a\\"b"}')
+        self.assertEqual(copy_value("a\tb\\c"), r"a\tb\\c")
+
+
+class CatalogSnapshotTestCase(TestCase):
+    def setUp(self):
+        # Not shared between tests, as tests change or delete the catalog's files.
+        with open("catalogs/data/5.0/cms_ars_50_low.json", "rb") as file:
+            self.cat = Catalog.objects.create(
+                name="ARS 5.0 Low", file_name=File(file), version=Catalog.Version.CMS_ARS_5_0
+            )
+        self.path = self.cat.file_name.path
+        with open(self.path, "rb") as file:
+            self.document = json.load(file)
+
+    def tearDown(self):
+        for path in (self.path, snapshot_path(self.path)):
+            if os.path.isfile(path):
+                os.remove(path)
+
+    def test_ingest_writes_snapshot(self):
+        self.assertTrue(snapshot_path(self.path).is_file())
+        self.assertEqual(snapshot_path(self.path).parent, Path(settings.CATALOG_SNAPSHOT_DIR))
+        self.assertDictEqual(read_snapshot(self.path), self.document)
+
+    def test_readers_load_snapshot(self):
+        model = CatalogModel.from_json(self.path)
+        expected = CatalogModel.from_document(self.document)
+
+        self.assertEqual(model, expected)
+        self.assertListEqual(
+            [(item.to_orm(), model.get_next(item)) for item in model.controls],
+            [(item.to_orm(), expected.get_next(item)) for item in expected.controls],
+        )
+        self.assertListEqual(Tools(self.path).get_controls_all(), Tools(self.document).get_controls_all())
+
+    def test_stale_snapshot_is_ignored(self):
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        self.assertIsNone(read_snapshot(self.path))
+        self.assertEqual(
+            CatalogModel.from_json(self.path).metadata.title, self.document["catalog"]["metadata"]["title"]
+        )
+
+        call_command("build_catalog_snapshots", stdout=StringIO())
+        self.assertIsNotNone(read_snapshot(self.path))
+
+    def test_snapshot_is_deleted_with_catalog(self):
+        self.cat.delete()
+        self.assertFalse(snapshot_path(self.path).exists())
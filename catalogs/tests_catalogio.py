@@ -1,10 +1,14 @@
+import json
+
 from typing import List
 
 from django.core.files import File
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from .catalogio import CatalogTools as Tools
+from .io.v5_0 import CatalogModel, Control
 from .models import Catalog
+from .readers import CatalogReaderV31, CatalogReaderV50, ControlStore, control_stores, get_reader_class, load_reader
 
 
 class CatalogModelTest(TestCase):
@@ -112,3 +116,163 @@ class CatalogModelTest(TestCase):
         """Get a control by the Control ID"""
         control = self.catalog.get_next_control_by_id("ac-1")
         self.assertEqual(control, "ac-2")
+
+    def test_get_next_control_by_id_last_control(self):
+        last = self.catalog.get_control_ids()[-1]
+        self.assertEqual(self.catalog.get_next_control_by_id(last), "")
+
+    def test_get_next_control_by_id_missing_control(self):
+        self.assertEqual(self.catalog.get_next_control_by_id("zz-1"), "")
+
+    def test_get_control_by_id_missing_control(self):
+        self.assertDictEqual(self.catalog.get_control_by_id("zz-1"), {})
+
+    def test_get_enhancements(self):
+        enhancements = self.catalog.get_enhancements()
+        self.assertEqual(len(enhancements), len(self.catalog.get_controls_all()) - len(self.catalog.get_controls()))
+
+    def test_control_statement_is_rendered_once(self):
+        control = self.catalog.get_control_by_id("ac-2")
+        self.assertIs(self.catalog.get_control_statement(control), self.catalog.get_control_statement(control))
+
+        # Controls from elsewhere are rendered but not stored.
+        copy = json.loads(json.dumps(control))
+        self.assertEqual(self.catalog.get_control_statement(copy), self.catalog.get_control_statement(control))
+        self.assertIsNot(self.catalog.get_control_statement(copy), self.catalog.get_control_statement(control))
+
+    def test_get_control_data_simplified(self):
+        data = self.catalog.get_control_data_simplified("ac-2")
+        self.assertEqual(data["title"], "Account Management")
+        self.assertEqual(data["family"], "Access Control")
+        self.assertEqual(data["next_id"], self.catalog.get_next_control_by_id("ac-2"))
+
+
+class CatalogModelV50Test(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.catalog = CatalogModel.from_json("catalogs/data/5.0/cms_ars_50_high.json")
+
+    def test_get_control(self):
+        control = self.catalog.get_control("ac-2")
+        self.assertEqual(control.title, "Account Management")
+        self.assertIsNone(self.catalog.get_control("zz-1"))
+
+    def test_controls_are_sorted(self):
+        sort_ids = [control.sort_id for control in self.catalog.controls]
+        self.assertListEqual(sort_ids, sorted(sort_ids))
+
+    def test_get_next(self):
+        self.assertEqual(self.catalog.get_next(self.catalog.get_control("ac-1")), "ac-2")
+        self.assertEqual(self.catalog.get_next(self.catalog.controls[-1]), "")
+
+    def test_get_next_skips_repeated_control(self):
+        self.assertEqual(self.catalog.get_next(self.catalog.get_control("ac-6.9")), "ac-6.10")
+
+    def test_statement_is_rendered_once(self):
+        control = self.catalog.get_control("ac-2")
+        self.assertIs(control.statement_parts, control.statement_parts)
+        self.assertIs(control.description, control.description)
+
+        # A copy that has not been rendered yet renders the same description on first use.
+        unrendered = Control.parse_obj(control.dict(by_alias=True, exclude_unset=True))
+        self.assertEqual(control.description, unrendered.description)
+
+    def test_control_summary(self):
+        summary = self.catalog.control_summary("ac-1")
+        self.assertEqual(summary["label"], "AC-01")
+        self.assertEqual(summary["family"], "ac")
+        self.assertEqual(summary["next_id"], "ac-2")
+
+
+class CatalogReaderTest(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.v31 = load_reader(Catalog.Version.CMS_ARS_3_1, "catalogs/data/3.1/CMS_ARS_3_1_HIGH-baseline_catalog.json")
+        cls.v50 = load_reader(Catalog.Version.CMS_ARS_5_0, "catalogs/data/5.0/cms_ars_50_high.json")
+
+    def test_reader_classes(self):
+        self.assertIsInstance(self.v31, CatalogReaderV31)
+        self.assertIsInstance(self.v50, CatalogReaderV50)
+        with self.assertRaises(ValueError):
+            get_reader_class("unknown")
+
+    def test_control_summary_matches_catalog_tools(self):
+        tools = Tools("catalogs/data/3.1/CMS_ARS_3_1_HIGH-baseline_catalog.json")
+        for control_id in ("ac-2", "ac-2.1"):
+            self.assertDictEqual(self.v31.control_summary(control_id), tools.get_control_data_simplified(control_id))
+
+    def test_control_summary_matches_catalog_model(self):
+        model = CatalogModel.from_json("catalogs/data/5.0/cms_ars_50_high.json")
+        for control_id in ("ac-2", "ac-2.1", "ac-6.9"):
+            self.assertDictEqual(self.v50.control_summary(control_id), model.control_summary(control_id))
+
+    def test_missing_control(self):
+        for reader in (self.v31, self.v50):
+            self.assertIsNone(reader.get_control("zz-1"))
+            self.assertDictEqual(
+                reader.control_summary("zz-1"),
+                {
+                    "label": "", "sort_id": "", "title": None, "family": None, "description": None,
+                    "implementation": "", "guidance": "", "next_id": "",
+                },
+            )
+            self.assertEqual(reader.get_next("zz-1"), "")
+            self.assertListEqual(reader.get_statement("zz-1"), [])
+
+    def test_next_and_previous(self):
+        for reader in (self.v31, self.v50):
+            self.assertEqual(reader.get_next("ac-1"), "ac-2")
+            self.assertEqual(reader.get_previous("ac-2"), "ac-1")
+            self.assertEqual(reader.get_previous("ac-1"), "")
+
+        self.assertEqual(self.v50.get_next("ac-6.9"), "ac-6.10")
+
+    def test_family(self):
+        self.assertEqual(self.v31.get_family("ac-2"), "Access Control")
+        self.assertEqual(self.v50.get_family("ac-2"), "ac")
+
+    def test_statement_and_parameters(self):
+        for reader in (self.v31, self.v50):
+            self.assertTrue(reader.get_statement("ac-2"))
+            self.assertIsInstance(reader.get_parameters("ac-2"), dict)
+
+        nist = load_reader(Catalog.Version.CMS_ARS_3_1, "blueprintapi/testdata/NIST_SP-800-53_rev5_test.json")
+        self.assertIn("ac-02_odp.01", nist.get_parameters("ac-2"))
+        self.assertEqual(nist.get_next("ac-2.1"), "")
+
+    def test_compact_statement_round_trip(self):
+        tools = Tools("catalogs/data/3.1/CMS_ARS_3_1_HIGH-baseline_catalog.json")
+        statement = tools.get_control_statement(tools.get_control_by_id("ac-2"))
+        self.assertListEqual(self.v31.get_statement("ac-2"), statement)
+
+        model = CatalogModel.from_json("catalogs/data/5.0/cms_ars_50_high.json")
+        self.assertListEqual(self.v50.get_statement("ac-2"), model.get_control("ac-2").statement_parts)
+
+    def test_search(self):
+        for reader in (self.v31, self.v50):
+            results = reader.search("ACCOUNT MANAGEMENT")
+            self.assertIn("ac-2", results)
+            self.assertNotIn("si-4", results)
+
+    def test_control_rows(self):
+        rows = self.v50.control_rows()
+        self.assertEqual(len(rows), len(CatalogModel.from_json("catalogs/data/5.0/cms_ars_50_high.json").controls))
+        self.assertNotIn("parameters", rows[0])
+        self.assertEqual(len(self.v31.control_rows()), len(self.v31.control_ids()))
+
+    def test_baselines_share_identical_controls(self):
+        low = load_reader(Catalog.Version.CMS_ARS_5_0, "catalogs/data/5.0/cms_ars_50_low.json")
+        self.assertIs(low.get_control("ac-1"), self.v50.get_control("ac-1"))
+        store = control_stores[Catalog.Version.CMS_ARS_5_0]
+        self.assertLess(len(store), len(self.v50.control_ids()) + len(low.control_ids()))
+
+    def test_store_ignores_key_order(self):
+        store = ControlStore()
+        control = {
+            "control_id": "ac-1", "control_label": "AC-01", "sort_id": "ac-01", "title": "Policy and Procedures",
+            "family": "ac", "description": "", "statement": [], "implementation": "", "guidance": "",
+        }
+        reordered = dict(reversed(control.items()))
+        self.assertIs(store.intern(control), store.intern(reordered))
@@ -1,10 +1,14 @@
 from django.urls import path
 
-from .views import CatalogListView, CatalogControlsView, CatalogControlDescriptionView
+from .views import (
+    CatalogListView, CatalogControlsView, CatalogControlsBatchView, CatalogControlDescriptionView, CatalogSearchView,
+)
 
 urlpatterns = [
     path("", CatalogListView.as_view(), name="catalog-list"),
     path("<int:catalog>/controls/all/", CatalogControlsView.as_view(), name="get_all_controls"),
+    path("<int:catalog>/controls/batch/", CatalogControlsBatchView.as_view(), name="get_controls_batch"),
+    path("<int:catalog>/search/", CatalogSearchView.as_view(), name="search_controls"),
     path(
         "<int:catalog>/control/<str:control_id>/", CatalogControlDescriptionView.as_view(), name="get_control_by_id",
     ),
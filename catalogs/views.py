@@ -1,25 +1,65 @@
-from pathlib import Path
+from typing import Optional
 
+from django.conf import settings
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F, Value
+from django.db.models.functions import Concat
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.request import Request
 
+from blueprintapi.conditional import ConditionalGetMixin, Validators, make_etag, query_key, queryset_stamp
 from .catalogio import CatalogTools as Tools
-from .models import Catalog
-from .serializers import CatalogListSerializer
+from .filters import ControlsFilter
+from .models import SEARCH_CONFIG, Catalog, Controls
+from .registry import get_catalog_reader, get_catalog_tools
+from .serializers import (
+    CatalogListSerializer, ControlBatchSerializer, ControlListSerializer, ControlSearchSerializer,
+)
 
 
-class CatalogListView(generics.ListAPIView):
+class CatalogConditionalGetMixin(ConditionalGetMixin):
+    """Catalogs are readable by anyone and only change when re-uploaded, so shared caches may store them."""
+    public_cache = True
+    cache_max_age = settings.CATALOG_HTTP_MAX_AGE
+
+    _catalog: Optional[Catalog] = None
+
+    def get_catalog(self) -> Catalog:
+        """Return the requested Catalog, looked up once per request for both the validators and the response."""
+        if self._catalog is None:
+            # GenericAPIView's lookup, as CatalogControlBaseView.get_object returns the parsed catalog instead.
+            self._catalog = generics.GenericAPIView.get_object(self)
+
+        return self._catalog
+
+    def get_validators(self, request: Request) -> Validators:
+        catalog = self.get_catalog()
+        updated = catalog.updated or catalog.created
+
+        return make_etag(catalog.pk, updated, self.kwargs, query_key(request)), updated
+
+
+class CatalogListView(ConditionalGetMixin, generics.ListAPIView):
     """Use for read-write endpoints to represent a collection of model instances.
     Provides get and post method handlers.
     """
     queryset = Catalog.objects.all().order_by("pk")
     permission_classes = [AllowAny, ]
     serializer_class = CatalogListSerializer
+    public_cache = True
+    cache_max_age = settings.CATALOG_HTTP_MAX_AGE
+
+    def get_validators(self, request: Request) -> Validators:
+        # Without a Last-Modified, as the latest update does not change when a catalog is deleted.
+        return make_etag(*queryset_stamp(self.get_queryset()), query_key(request)), None
 
 
-class CatalogControlBaseView(generics.GenericAPIView):
+# pylint: disable-next=too-many-ancestors
+class CatalogControlBaseView(CatalogConditionalGetMixin, generics.RetrieveAPIView):
     queryset = Catalog.objects.all()
     permission_classes = [AllowAny, ]
     lookup_url_kwarg = "catalog"
@@ -27,23 +67,124 @@ class CatalogControlBaseView(generics.GenericAPIView):
     @staticmethod
     def _parse_catalog(catalog: Catalog) -> Tools:
         """Parse Catalog instance into CatalogTools for easy data access."""
-        return Tools(Path(catalog.file_name.path))
+        return get_catalog_tools(catalog)
 
     def get_object(self):
-        instance = super().get_object()
+        instance = self.get_catalog()
         return self._parse_catalog(instance)
 
 
+class ControlsPagination(PageNumberPagination):
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+# pylint: disable-next=too-many-ancestors
 class CatalogControlsView(CatalogControlBaseView):
-    def get(self, request: Request, *args, **kwargs) -> Response:
-        catalog = self.get_object()
+    """List the controls of a catalog.
+
+    Without query parameters the catalog's raw control tree is returned. With any of ``page``, ``page_size``,
+    ``family``, ``id`` (comma separated) or ``fields`` (comma separated) the stored control content is returned a page
+    at a time instead.
+    """
+    pagination_class = ControlsPagination
+    list_params = {"page", "page_size", "family", "id", "fields"}
+
+    def _list_controls(self, catalog: Catalog, request: Request) -> Response:
+        filterset = ControlsFilter(
+            request.query_params, queryset=Controls.objects.filter(catalog=catalog).order_by("sort_id", "pk")
+        )
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        page = self.paginate_queryset(filterset.qs)
+        serializer = ControlListSerializer(page, many=True, context=self.get_serializer_context())
+
+        return self.get_paginated_response(serializer.data)
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        instance = self.get_catalog()
+
+        if self.list_params.intersection(request.query_params):
+            return self._list_controls(instance, request)
+
+        return Response({"controls": self._parse_catalog(instance).get_controls_all()}, status=status.HTTP_200_OK)
+
+
+class CatalogControlsBatchView(generics.GenericAPIView):
+    """Return the summaries of up to 500 controls, given as ``{"ids": [...]}``, in one response.
+
+    Summaries come from the catalog's cached reader; ids that are not in the catalog are listed under ``missing``.
+    """
+    queryset = Catalog.objects.all()
+    permission_classes = [AllowAny, ]
+    lookup_url_kwarg = "catalog"
+    serializer_class = ControlBatchSerializer
+
+    def post(self, request: Request, *args, **kwargs) -> Response:
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        reader = get_catalog_reader(self.get_object())
+        controls, missing = {}, []
+        for control_id in serializer.validated_data["ids"]:
+            if reader.get_control(control_id) is None:
+                missing.append(control_id)
+            else:
+                controls[control_id] = reader.control_summary(control_id)
+
+        return Response({"controls": controls, "missing": missing})
+
+
+# pylint: disable-next=too-many-ancestors
+class CatalogControlDescriptionView(CatalogConditionalGetMixin, generics.RetrieveAPIView):
+    queryset = Catalog.objects.all()
+    permission_classes = [AllowAny, ]
+    lookup_url_kwarg = "catalog"
+
+    def retrieve(self, request: Request, *args, **kwargs) -> Response:
+        statement = (
+            Controls.objects.filter(catalog=self.get_catalog(), control_id=self.kwargs["control_id"])
+            .values_list("statement", flat=True)
+            .first()
+        )
+
+        return Response({"description": statement or []})
+
+
+# pylint: disable-next=too-many-ancestors
+class CatalogSearchView(CatalogConditionalGetMixin, generics.ListAPIView):
+    """Search the text of a catalog's controls.
+
+    ``q`` uses web search syntax: quoted phrases, ``or`` and ``-`` to exclude words. Matches are ordered by rank, with
+    the matching words highlighted in ``headline``.
+    """
+    queryset = Catalog.objects.all()
+    permission_classes = [AllowAny, ]
+    lookup_url_kwarg = "catalog"
+    serializer_class = ControlSearchSerializer
+    pagination_class = ControlsPagination
 
-        return Response({"controls": catalog.get_controls_all()}, status=status.HTTP_200_OK)
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        if not (text := request.query_params.get("q", "").strip()):
+            raise ValidationError({"q": "A search query is required."})
 
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+        controls = (
+            Controls.objects.filter(catalog=self.get_catalog(), search_vector=query)
+            .annotate(
+                rank=SearchRank(F("search_vector"), query),
+                headline=SearchHeadline(
+                    Concat("description", Value(" "), "implementation", Value(" "), "guidance"),
+                    query,
+                    config=SEARCH_CONFIG,
+                    max_fragments=3,
+                ),
+            )
+            .order_by("-rank", "sort_id", "pk")
+        )
 
-class CatalogControlDescriptionView(CatalogControlBaseView):
-    def get(self, request: Request, control_id: str, *args, **kwargs) -> Response:
-        catalog = self.get_object()
-        control = catalog.get_control_by_id(control_id)
+        page = self.paginate_queryset(controls)
+        serializer = self.get_serializer(page, many=True)
 
-        return Response({"description": catalog.get_control_statement(control)})
+        return self.get_paginated_response(serializer.data)
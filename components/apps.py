@@ -1,5 +1,5 @@
 from django.apps import AppConfig
-from django.db.models.signals import pre_save
+from django.db.models.signals import post_delete, post_save, pre_save
 
 
 class ComponentsConfig(AppConfig):
@@ -8,7 +8,8 @@ class ComponentsConfig(AppConfig):
 
     def ready(self):
         from components.signals import (
-            parse_component_json, add_description, convert_to_lowercase, add_controls, add_supported_catalog_versions
+            parse_component_json, add_description, convert_to_lowercase, add_controls, add_supported_catalog_versions,
+            invalidate_component_cache, update_narratives,
         )
 
         signal_setup = [
@@ -21,3 +22,11 @@ class ComponentsConfig(AppConfig):
 
         for receiver, uid in signal_setup:
             pre_save.connect(receiver, sender="components.Component", dispatch_uid=uid)
+
+        post_save.connect(
+            invalidate_component_cache, sender="components.Component", dispatch_uid="invalidate_saved_component"
+        )
+        post_save.connect(update_narratives, sender="components.Component", dispatch_uid="update_component_narratives")
+        post_delete.connect(
+            invalidate_component_cache, sender="components.Component", dispatch_uid="invalidate_deleted_component"
+        )
@@ -0,0 +1,80 @@
+# Generated by Django 4.1.1 on 2026-10-18 08:43
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+CATALOG_VERSIONS = ("CMS_ARS_3_1", "CMS_ARS_5_0")
+
+
+def populate_narratives(apps, schema_editor):
+    """Copy the implemented requirements of existing components into ComponentNarrative.
+
+    Reads component_json directly, as ParsedComponent did when this migration was written: the first implementation
+    of each catalog version and the first requirement of each control are used, and implementations whose
+    description is not a catalog version are skipped.
+    """
+    Component = apps.get_model("components", "Component")
+    ComponentNarrative = apps.get_model("components", "ComponentNarrative")
+
+    def _prop(requirement: dict, name: str):
+        return next((prop.get("value") for prop in requirement.get("props") or [] if prop.get("name") == name), None)
+
+    for component in Component.objects.exclude(component_json__isnull=True).iterator():
+        if not component.component_json:
+            continue
+
+        definition = component.component_json["component-definition"]["components"][0]
+        narratives = {}
+        versions = set()
+        for implementation in definition.get("control-implementations", []):
+            version = implementation.get("description")
+            if version not in CATALOG_VERSIONS or version in versions:
+                continue
+            versions.add(version)
+
+            for requirement in implementation.get("implemented-requirements", []):
+                narratives.setdefault(
+                    (version, requirement["control-id"]),
+                    ComponentNarrative(
+                        component=component,
+                        catalog_version=version,
+                        control_id=requirement["control-id"],
+                        description=requirement.get("description", ""),
+                        responsibility=_prop(requirement, "security_control_type"),
+                        provider=_prop(requirement, "provider"),
+                    ),
+                )
+
+        ComponentNarrative.objects.bulk_create(narratives.values())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('components', '0005_remove_component_catalog_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ComponentNarrative',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('catalog_version', models.CharField(choices=[('CMS_ARS_3_1', 'CMS ARS 3.1'), ('CMS_ARS_5_0', 'CMS ARS 5.0')], help_text='Catalog version of the control implementation, for example CMS_ARS_5_0', max_length=16)),
+                ('control_id', models.CharField(help_text='Catalog control ID, for example ac-1', max_length=30)),
+                ('description', models.TextField(blank=True, default='', help_text='How the component implements the control.')),
+                ('responsibility', models.TextField(blank=True, help_text='Security control type, for example Allocated or Inherited', null=True)),
+                ('provider', models.TextField(blank=True, help_text='Whether the component provides the control, Yes or No', null=True)),
+                ('component', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='narratives', to='components.component')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='componentnarrative',
+            index=models.Index(fields=['catalog_version', 'control_id'], name='components__catalog_dc1d6c_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='componentnarrative',
+            unique_together={('component', 'catalog_version', 'control_id')},
+        ),
+        migrations.RunPython(populate_narratives, migrations.RunPython.noop),
+    ]
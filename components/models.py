@@ -1,5 +1,5 @@
 from django.contrib.postgres.fields import ArrayField
-from django.db import models
+from django.db import models, transaction
 
 from catalogs.models import Catalog
 
@@ -63,3 +63,37 @@ class Component(models.Model):
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        # The component's narratives are rewritten by a post_save signal, in the same transaction as the save.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class ComponentNarrative(models.Model):
+    """An implemented requirement of a component, copied out of its component_json for indexed lookups by control."""
+    component = models.ForeignKey(to="components.Component", on_delete=models.CASCADE, related_name="narratives")
+    catalog_version = models.CharField(
+        choices=Catalog.Version.choices,
+        max_length=16,
+        help_text="Catalog version of the control implementation, for example CMS_ARS_5_0",
+    )
+    control_id = models.CharField(max_length=30, help_text="Catalog control ID, for example ac-1")
+    description = models.TextField(blank=True, default="", help_text="How the component implements the control.")
+    responsibility = models.TextField(
+        null=True,
+        blank=True,
+        help_text="Security control type, for example Allocated or Inherited",
+    )
+    provider = models.TextField(
+        null=True,
+        blank=True,
+        help_text="Whether the component provides the control, Yes or No",
+    )
+
+    class Meta:
+        indexes = [models.Index(fields=["catalog_version", "control_id"])]
+        unique_together = ("component", "catalog_version", "control_id")
+
+    def __str__(self):
+        return f"{self.component_id} {self.catalog_version} {self.control_id}"
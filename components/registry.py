@@ -0,0 +1,85 @@
+import copy
+import logging
+
+from typing import Dict, ItemsView, Optional, Tuple
+
+from django.conf import settings
+
+from blueprintapi.cache import LRUCache
+from blueprintapi.oscal.component import Component as ComponentDefinition, ImplementedRequirement, Model
+from components.models import Component
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedComponent:
+    """A component's validated OSCAL model, with its implemented requirements indexed by catalog version and control.
+
+    Entries are shared between requests, so the model must not be modified; use ``model_copy`` for edits.
+    """
+
+    def __init__(self, model: Model):
+        self.model = model
+        # Assume a single item in the "component" field, as elsewhere.
+        self.definition: ComponentDefinition = model.component_definition.components[0]
+
+        self._requirements: Dict[Tuple[str, str], ImplementedRequirement] = {}
+        versions = set()
+        for implementation in self.definition.control_implementations:
+            if implementation.description in versions:  # Only the first implementation of a version is used.
+                continue
+            versions.add(implementation.description)
+
+            for requirement in implementation.implemented_requirements:
+                self._requirements.setdefault((implementation.description, requirement.control_id), requirement)
+
+    def get_control(self, control_id: str, catalog_version: str) -> Optional[ImplementedRequirement]:
+        return self._requirements.get((catalog_version, control_id))
+
+    def requirements(self) -> ItemsView[Tuple[str, str], ImplementedRequirement]:
+        """The implemented requirement used for each (catalog version, control id)."""
+        return self._requirements.items()
+
+    def model_copy(self) -> Model:
+        return copy.deepcopy(self.model)
+
+
+class ComponentRegistry:
+    """Process-wide cache of parsed component definitions, keyed by ``Component.pk`` and ``Component.updated``.
+
+    ``updated`` changes on every save, so an edited component is parsed again on its next use even in processes that
+    did not receive the save signal.
+    """
+
+    def __init__(self, maxsize: int):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def get(self, component: Component) -> ParsedComponent:
+        """Return the parsed component, parsing its component_json on a cache miss."""
+        if component.pk is None:  # Not saved yet, so there is nothing stable to key it by.
+            return ParsedComponent(Model(**component.component_json))
+
+        key = (component.pk, component.updated)
+
+        def _load() -> ParsedComponent:
+            self._cache.evict(lambda key_: key_[0] == component.pk)
+            logger.debug("Parsing component %s into the component registry.", component)
+            return ParsedComponent(Model(**component.component_json))
+
+        return self._cache.get_or_set(key, _load)
+
+    def invalidate(self, component_pk: int) -> int:
+        return self._cache.evict(lambda key: key[0] == component_pk)
+
+    def clear(self):
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+component_registry = ComponentRegistry(maxsize=getattr(settings, "COMPONENT_CACHE_SIZE", 128))
+
+
+def get_parsed_component(component: Component) -> ParsedComponent:
+    return component_registry.get(component)
@@ -2,22 +2,42 @@ import json
 
 from typing import Any, List, Optional, Tuple
 
-from django.db.models import TextChoices
+from django.db.models import F, QuerySet, TextChoices
+from django.db.models.functions import Coalesce
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework.request import Request
 
 from blueprintapi.oscal.component import ImplementedRequirement, Model
-from catalogs.catalogio import CatalogTools
+from blueprintapi.serializers import SparseFieldsetMixin, expands
 from catalogs.models import Catalog
+from catalogs.registry import get_catalog_reader
 from components.models import Component
+from components.registry import get_parsed_component
 from projects.models import Project
 
 
-class ComponentListSerializer(serializers.ModelSerializer):
+def component_list_queryset(queryset: QuerySet, request: Optional[Request]) -> QuerySet:
+    """Components as listed by ComponentListSerializer.
+
+    component_json is only fetched when the request expands it, and controls_count is computed by the database.
+    """
+    queryset = queryset.annotate(controls_count=Coalesce(F("controls__len"), 0))
+    if not expands(request, "component_json"):
+        queryset = queryset.defer("component_json")
+
+    return queryset
+
+
+class ComponentListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """Components in lists. component_json can be large, so it is only included with ``?expand=component_json``."""
     controls_count = serializers.SerializerMethodField()
 
     def get_controls_count(self, obj):
-        return len(obj.controls)
+        if (count := getattr(obj, "controls_count", None)) is not None:  # Annotated by component_list_queryset
+            return count
+
+        return len(obj.controls or [])
 
     class Meta:
         model = Component
@@ -32,9 +52,10 @@ class ComponentListSerializer(serializers.ModelSerializer):
             "controls_count",
         )
         read_only_fields = ("supported_catalog_versions", "id", )
+        expandable_fields = ("component_json", )
 
 
-class ComponentSerializer(serializers.ModelSerializer):
+class ComponentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     catalog_data = serializers.SerializerMethodField()
     component_data = serializers.SerializerMethodField()
     project_data = serializers.SerializerMethodField()
@@ -60,7 +81,7 @@ class ComponentSerializer(serializers.ModelSerializer):
         return data
 
     def get_component_data(self, obj):
-        data = collect_component_data(obj.component_json)
+        data = collect_component_data(obj)
         return data
 
     def get_project_data(self, obj):
@@ -100,17 +121,16 @@ def collect_catalog_data(controls: list, catalog_versions: List[Catalog.Version]
         if (version := catalog.version) not in data:
             data[version] = {}
 
-        cat_data = CatalogTools(catalog.file_name.path)
+        reader = get_catalog_reader(catalog)
         data[version][catalog.impact_level] = {
-            "controls": {control: cat_data.get_control_data_simplified(control) for control in controls}
+            "controls": {control: reader.control_summary(control) for control in controls}
         }
 
     return data
 
 
-def collect_component_data(component: dict) -> dict:
-    component_model = Model(**component)
-    component_def = component_model.component_definition.components[0]
+def collect_component_data(component: Component) -> dict:
+    component_def = get_parsed_component(component).definition
 
     return {
         "title": component_def.title,
@@ -139,7 +159,7 @@ def get_control_responsibility(control: dict, name: str) -> Optional[Any]:
                 return prop.get("value")
 
 
-class ComponentListBasicSerializer(serializers.ModelSerializer):
+class ComponentListBasicSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     controls_count = serializers.SerializerMethodField()
 
     def get_controls_count(self, obj):
@@ -157,7 +177,7 @@ class ComponentListBasicSerializer(serializers.ModelSerializer):
         )
 
 
-class ComponentControlSerializer(serializers.ModelSerializer):
+class ComponentControlSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Action(TextChoices):
         ADD = "add", _("Add control")
         REMOVE = "remove", _("Remove control")
@@ -235,7 +255,7 @@ class ComponentControlSerializer(serializers.ModelSerializer):
             instance: Component, catalog_version: str
     ) -> Optional[Tuple[List[ImplementedRequirement], Model]]:
         """Find the sections of a Component's json that needs to be updated."""
-        component_data = Model(**instance.component_json)
+        component_data = get_parsed_component(instance).model_copy()
 
         for component in component_data.component_definition.components:
             for implementation in component.control_implementations:
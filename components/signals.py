@@ -1,8 +1,10 @@
 import json
 
 from blueprintapi.oscal.component import Model as ComponentModel
+from catalogs.models import Catalog
 from components.componentio import ComponentTools
-from components.models import Component
+from components.models import Component, ComponentNarrative
+from components.registry import ParsedComponent, component_registry
 
 
 # noinspection PyUnusedLocal
@@ -47,3 +49,35 @@ def add_supported_catalog_versions(sender, instance: Component, *args, **kwargs)
         # Assume a single item in the "component" field for now
         implemented_versions = component_data.component_definition.components[0].catalog_versions
         instance.supported_catalog_versions = implemented_versions
+
+
+# noinspection PyUnusedLocal
+def invalidate_component_cache(sender, instance: Component, **kwargs):  # pylint: disable=unused-argument
+    """Drop the parsed copy of a saved or deleted Component from this process's component registry."""
+    component_registry.invalidate(instance.pk)
+
+
+# noinspection PyUnusedLocal
+def update_narratives(sender, instance: Component, **kwargs):  # pylint: disable=unused-argument
+    """Rewrite the ComponentNarrative rows of a saved Component from its component_json.
+
+    The json is parsed here rather than through the component registry, so saves (and bulk loads) do not fill it.
+    Implementations whose description is not a catalog version are skipped, as in ``Component.catalog_versions``.
+    """
+    ComponentNarrative.objects.filter(component=instance).delete()
+    if not instance.component_json:
+        return
+
+    parsed = ParsedComponent(ComponentModel(**instance.component_json))
+    ComponentNarrative.objects.bulk_create(
+        ComponentNarrative(
+            component=instance,
+            catalog_version=catalog_version,
+            control_id=control_id,
+            description=requirement.description,
+            responsibility=requirement.responsibility,
+            provider=requirement.provider,
+        )
+        for (catalog_version, control_id), requirement in parsed.requirements()
+        if catalog_version in Catalog.Version.values
+    )
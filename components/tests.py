@@ -1,3 +1,4 @@
+import copy
 import json
 from typing import List
 
@@ -10,8 +11,9 @@ from rest_framework.authtoken.models import Token
 
 from catalogs.models import Catalog
 from components.componentio import ComponentTools, create_empty_component_json
-from components.models import Component
-from components.serializers import ComponentListSerializer, ComponentSerializer
+from components.models import Component, ComponentNarrative
+from components.registry import component_registry, get_parsed_component
+from components.serializers import ComponentListSerializer, ComponentSerializer, component_list_queryset
 from testing_utils import AuthenticatedAPITestCase, prevent_request_warnings
 from users.models import User
 
@@ -116,6 +118,21 @@ class GetAllComponentsTest(AuthenticatedAPITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(received_controls_count, expected_controls_count)
 
+    def test_component_json_only_when_expanded(self):
+        response = self.client.get(reverse("component-list"))
+        self.assertNotIn("component_json", response.data[0])
+
+        for query in ({"expand": "component_json"}, {"fields": "id,component_json"}):
+            with self.subTest(query=query):
+                response = self.client.get(reverse("component-list"), query)
+                self.assertEqual(response.data[0]["component_json"], TEST_COMPONENT_JSON_BLOB)
+
+    def test_list_does_not_fetch_component_json(self):
+        queryset = component_list_queryset(Component.objects.order_by("pk"), None)
+
+        self.assertSetEqual(queryset.query.deferred_loading[0], {"component_json"})
+        self.assertEqual(queryset[0].controls_count, len(TEST_COMPONENT_CONTROLS))
+
 
 class GetSingleComponentTest(AuthenticatedAPITestCase):
     @classmethod
@@ -140,6 +157,21 @@ class GetSingleComponentTest(AuthenticatedAPITestCase):
         self.assertEqual(response.data, serializer.data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+    def test_conditional_get(self):
+        url = reverse("component-detail", kwargs={"pk": self.test_component.pk})
+        response = self.client.get(url)
+
+        self.assertIn("private", response["Cache-Control"])
+        self.assertEqual(
+            self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, status.HTTP_304_NOT_MODIFIED
+        )
+
+        response = self.client.get(url, {"fields": "id"}, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.test_component.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, status.HTTP_200_OK)
+
     @prevent_request_warnings
     def test_get_invalid_single_component(self):
         invalid_id = 0
@@ -271,6 +303,19 @@ class ComponentViewTest(AuthenticatedAPITestCase):
         content = resp.json()
         self.assertEqual(content[3].get("total_item_count"), 3)
 
+    def test_search_conditional_get(self):
+        etag = self.client.get("/api/components/search/?type=policy")["ETag"]
+
+        resp = self.client.get("/api/components/search/?type=policy", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        resp = self.client.get("/api/components/search/?type=software", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
+        self.test_component_3.delete()
+        resp = self.client.get("/api/components/search/?type=policy", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+
     def test_search_query_win(self):
         resp = self.client.get("/api/components/search/?search=win", format="json")
         expected_response = [{"total_item_count": 0}]
@@ -338,6 +383,99 @@ class ComponentioTest(TestCase):
         self.assertEqual(ids[0], "ac-1")
 
 
+class ComponentRegistryTest(TestCase):
+    def setUp(self):
+        component_registry.clear()
+        self.component = Component.objects.create(
+            title="Cool Component",
+            supported_catalog_versions=[Catalog.Version.CMS_ARS_3_1],
+            component_json=TEST_COMPONENT_JSON_BLOB,
+        )
+
+    def test_parsed_component_is_reused(self):
+        parsed = get_parsed_component(self.component)
+
+        self.assertIs(get_parsed_component(Component.objects.get(pk=self.component.pk)), parsed)
+        self.assertDictEqual(component_registry.stats(), {"hits": 1, "misses": 1, "size": 1, "maxsize": 128})
+
+    def test_get_control(self):
+        parsed = get_parsed_component(self.component)
+
+        requirement = parsed.get_control("ac-2", Catalog.Version.CMS_ARS_3_1)
+        self.assertEqual(requirement.description, "This component statisfies b.")
+        self.assertIsNone(parsed.get_control("ac-2", Catalog.Version.CMS_ARS_5_0))
+        self.assertIsNone(parsed.get_control("zz-1", Catalog.Version.CMS_ARS_3_1))
+
+    def test_saving_component_invalidates_entry(self):
+        parsed = get_parsed_component(self.component)
+        self.component.save()
+
+        self.assertEqual(component_registry.stats()["size"], 0)
+        self.assertIsNot(get_parsed_component(self.component), parsed)
+
+    def test_model_copy_leaves_entry_unchanged(self):
+        parsed = get_parsed_component(self.component)
+        parsed.model_copy().component_definition.components[0].control_implementations.clear()
+
+        self.assertEqual(len(parsed.definition.control_implementations), 1)
+
+
+class ComponentNarrativeTest(TestCase):
+    def setUp(self):
+        self.component = Component.objects.create(
+            title="Cool Component",
+            supported_catalog_versions=[Catalog.Version.CMS_ARS_3_1],
+            component_json=copy.deepcopy(TEST_COMPONENT_JSON_BLOB),
+        )
+
+    def test_narratives_created_on_save(self):
+        narratives = ComponentNarrative.objects.filter(component=self.component)
+
+        self.assertListEqual(
+            sorted(narratives.values_list("control_id", flat=True)), ["ac-1", "ac-2", "at-1", "at-2", "at-3"]
+        )
+        narrative = narratives.get(control_id="ac-2")
+        self.assertEqual(narrative.catalog_version, Catalog.Version.CMS_ARS_3_1)
+        self.assertEqual(narrative.description, "This component statisfies b.")
+
+    def test_narratives_follow_edits(self):
+        implementation = self.component.component_json["component-definition"]["components"][0][
+            "control-implementations"
+        ][0]
+        implementation["implemented-requirements"] = [
+            {**requirement, "description": "Updated."}
+            for requirement in implementation["implemented-requirements"]
+            if requirement["control-id"] != "at-3"
+        ]
+        self.component.save()
+
+        narratives = ComponentNarrative.objects.filter(component=self.component)
+        self.assertFalse(narratives.filter(control_id="at-3").exists())
+        self.assertSetEqual(set(narratives.values_list("description", flat=True)), {"Updated."})
+
+    def test_implementations_that_are_not_catalog_versions_are_skipped(self):
+        implementations = self.component.component_json["component-definition"]["components"][0][
+            "control-implementations"
+        ]
+        implementations.append(
+            {
+                **implementations[0],
+                "uuid": "b4d1e7a2-3c5f-4e8a-9b0d-1f2e3a4b5c6d",
+                "description": "Controls implemented for the internal review of this component",
+            }
+        )
+        self.component.save()
+
+        narratives = ComponentNarrative.objects.filter(component=self.component)
+        self.assertSetEqual(set(narratives.values_list("catalog_version", flat=True)), {Catalog.Version.CMS_ARS_3_1})
+        self.assertEqual(narratives.count(), 5)
+
+    def test_narratives_deleted_with_component(self):
+        self.component.delete()
+
+        self.assertFalse(ComponentNarrative.objects.exists())
+
+
 class ComponentTypesViewTest(AuthenticatedAPITestCase):
     @classmethod
     def setUpTestData(cls):
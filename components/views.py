@@ -1,3 +1,5 @@
+from typing import Optional
+
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.db.models import QuerySet
 from django_filters import rest_framework as filters
@@ -5,6 +7,8 @@ from rest_framework import generics, status
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from blueprintapi.conditional import ConditionalGetMixin, Validators, make_etag, query_key, queryset_stamp
+from catalogs.models import Catalog
 from components.filters import ComponentFilter, ComponentPermissionsFilter
 from components.models import Component
 from components.permissions import ComponentPermissions
@@ -12,7 +16,9 @@ from components.serializers import (
     ComponentControlSerializer,
     ComponentListSerializer,
     ComponentSerializer,
+    component_list_queryset,
 )
+from projects.models import Project
 
 
 class ComponentListView(generics.ListCreateAPIView):
@@ -24,12 +30,15 @@ class ComponentListView(generics.ListCreateAPIView):
     permission_classes = [ComponentPermissions, ]
     filter_backends = [ComponentPermissionsFilter, ]
 
+    def get_queryset(self) -> QuerySet:
+        return component_list_queryset(super().get_queryset(), self.request)
+
     def filter_queryset(self, queryset: QuerySet) -> QuerySet:
         # Need to apply the order_by after the union in ComponentPermissionsFilter
         return super().filter_queryset(queryset).order_by("pk")
 
 
-class ComponentDetailView(generics.RetrieveAPIView):
+class ComponentDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
     """
     Use for read or update endpoints to represent a single model instance.
     Provides get, put, and patch method handlers.
@@ -37,15 +46,46 @@ class ComponentDetailView(generics.RetrieveAPIView):
     queryset = Component.objects.all()
     permission_classes = [ComponentPermissions, ]
     serializer_class = ComponentSerializer
+    _object: Optional[Component] = None
+
+    def get_object(self) -> Component:
+        if self._object is None:
+            self._object = super().get_object()
+
+        return self._object
+
+    def get_validators(self, request: Request) -> Validators:
+        """The response also depends on the catalogs the component supports and on the requesting user's projects."""
+        component = self.get_object()
+        user = request.user
+        projects = Project.objects.filter(creator_id=user).order_by("pk").values_list("pk", "title")
+        memberships = (
+            Project.components.through.objects.filter(component_id=component.pk, project__creator_id=user)
+            .order_by("project_id")
+            .values_list("project_id", flat=True)
+        )
+        catalogs = queryset_stamp(Catalog.objects.filter(version__in=component.supported_catalog_versions))
 
+        etag = make_etag(
+            component.pk, component.updated, user.pk, list(projects), list(memberships), catalogs, query_key(request)
+        )
 
-class ComponentListSearchView(generics.ListAPIView):
+        return etag, None
+
+
+class ComponentListSearchView(ConditionalGetMixin, generics.ListAPIView):
     queryset = Component.objects.exclude(status=Component.Status.SYSTEM).order_by("pk")
     permission_classes = [ComponentPermissions, ]
     filterset_class = ComponentFilter
     filter_backends = [filters.DjangoFilterBackend, ]
     serializer_class = ComponentListSerializer
 
+    def get_queryset(self) -> QuerySet:
+        return component_list_queryset(super().get_queryset(), self.request)
+
+    def get_validators(self, request: Request) -> Validators:
+        return make_etag(*queryset_stamp(self.filter_queryset(self.get_queryset())), query_key(request)), None
+
     def list(self, request, *args, **kwargs):
         queryset = self.filter_queryset(self.get_queryset())
         page_number = self.request.query_params.get("page", default=1)
@@ -7,7 +7,9 @@ class ProjectConfig(AppConfig):
     name = "projects"
 
     def ready(self):
-        from projects.signals import post_create_setup, add_catalog
+        from catalogs.revisions import controls_revised
+        from projects.signals import post_create_setup, add_catalog, revise_project_controls
 
         pre_save.connect(add_catalog, sender="projects.Project", dispatch_uid="project_pre_save_setup")
         post_save.connect(post_create_setup, sender="projects.Project", dispatch_uid="project_post_save_setup")
+        controls_revised.connect(revise_project_controls, dispatch_uid="revise_project_controls")
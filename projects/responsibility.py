@@ -0,0 +1,85 @@
+import json
+
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
+
+from components.models import Component, ComponentNarrative
+from projects.models import Project, ProjectControl
+
+NARRATIVE_TYPES = {
+    Component.Status.PUBLIC: "inherited",
+    Component.Status.SYSTEM: "private",
+}
+
+
+def rollup_responsibility(responsibilities: List[Optional[str]]) -> Optional[str]:
+    """The responsibility of a control given those of the components implementing it.
+
+    Controls no component implements are Allocated, and controls more than one component implements are Hybrid.
+    """
+    if len(responsibilities) > 1:
+        return "Hybrid"
+    if len(responsibilities) == 1:
+        return responsibilities[0]
+
+    return "Allocated"
+
+
+def _project_narratives(project: Project) -> Dict[str, List[dict]]:
+    """The narratives of the project's components for its catalog version, by control id."""
+    narratives = defaultdict(list)
+    rows = ComponentNarrative.objects.filter(
+        component__in=project.components.all(),
+        catalog_version=project.catalog.version,
+    ).values(
+        "pk", "control_id", "responsibility", "provider", "component_id", "component__title", "component__status",
+    ).order_by("component_id")
+
+    for row in rows:
+        narratives[row["control_id"]].append(row)
+
+    return narratives
+
+
+def _control_entry(control_id: str, status: str, disabled_narratives: List[int], narratives: List[dict]) -> dict:
+    components = {"inherited": {}, "private": None}
+    for narrative in narratives:
+        entry = {
+            "id": narrative["component_id"],
+            "narrative_id": narrative["pk"],
+            "enabled": narrative["component_id"] not in disabled_narratives,
+        }
+
+        if NARRATIVE_TYPES[narrative["component__status"]] == "private":
+            components["private"] = entry
+        else:
+            components["inherited"][narrative["component__title"]] = {
+                **entry,
+                "responsibility": narrative["responsibility"],
+                "provider": narrative["provider"],
+            }
+
+    return {
+        "control_id": control_id,
+        "status": status,
+        "responsibility": rollup_responsibility([narrative["responsibility"] for narrative in narratives]),
+        "components": components,
+    }
+
+
+def iter_responsibility_matrix(project: Project) -> Iterator[str]:
+    """Yield the responsibility matrix of a project as chunks of a JSON document.
+
+    The narratives of every component in the project are read in one query and each project control is then rolled
+    up from them, so the controls can be streamed in catalog order as they are read.
+    """
+    narratives = _project_narratives(project)
+    controls = ProjectControl.objects.filter(project=project).values_list(
+        "control__control_id", "status", "disabled_narratives",
+    ).order_by("control__sort_id", "control_id")
+
+    yield f'{{"project": {project.pk}, "catalog_version": {json.dumps(project.catalog.version)}, "controls": ['
+    for index, (control_id, status, disabled_narratives) in enumerate(controls.iterator(chunk_size=500)):
+        entry = _control_entry(control_id, status, disabled_narratives, narratives.get(control_id, []))
+        yield ("," if index else "") + json.dumps(entry)
+    yield "]}"
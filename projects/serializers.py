@@ -1,18 +1,15 @@
 from typing import Optional
 from rest_framework import serializers
 
-from catalogs.catalogio import CatalogTools
-from catalogs.io.v5_0 import CatalogModel
-from catalogs.models import Catalog
+from blueprintapi.serializers import SparseFieldsetMixin
 from catalogs.serializers import ControlSerializer
-from components.models import Component
+from components.models import ComponentNarrative
 from components.serializers import ComponentListSerializer
 from projects.models import Project, ProjectControl
+from projects.responsibility import NARRATIVE_TYPES, rollup_responsibility
 
-from blueprintapi.oscal.component import Model as ComponentModel
 
-
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     completed_controls = serializers.IntegerField(required=False)
     total_controls = serializers.IntegerField(required=False)
 
@@ -38,7 +35,7 @@ class ProjectListSerializer(serializers.ModelSerializer):
         )
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     components = ComponentListSerializer(many=True)
     components_count = serializers.SerializerMethodField()
     completed_controls = serializers.IntegerField(required=False)
@@ -68,7 +65,7 @@ class ProjectSerializer(serializers.ModelSerializer):
         depth = 1
 
 
-class BasicViewProjectSerializer(serializers.ModelSerializer):
+class BasicViewProjectSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """Project serializer for the case where only basic project info is needed."""
     private_component = serializers.SerializerMethodField(read_only=True)
 
@@ -82,7 +79,7 @@ class BasicViewProjectSerializer(serializers.ModelSerializer):
         return obj.components.get(title=f"{obj.title} private").id
 
 
-class ProjectControlSerializer(serializers.ModelSerializer):
+class ProjectControlSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     control = ControlSerializer(read_only=True)
     project = BasicViewProjectSerializer(read_only=True)
     catalog_data = serializers.SerializerMethodField(read_only=True)
@@ -133,23 +130,12 @@ class ProjectControlSerializer(serializers.ModelSerializer):
 
         return instance
 
+    # noinspection PyMethodMayBeStatic
     def get_catalog_data(self, obj: ProjectControl) -> Optional[dict]:
         """Get the Catalog data for a given Control."""
-        control_data = {}
-
-        file = obj.control.catalog.file_name.path
-        control_id = self.context.get("control_id")
-
-        match obj.project.catalog_version:
-            case Catalog.Version.CMS_ARS_3_1:
-                catalog = CatalogTools(file)
-                control_data = catalog.get_control_data_simplified(control_id=control_id)
-                control_data["version"] = catalog.catalog_title
-            case Catalog.Version.CMS_ARS_5_0:
-                catalog = CatalogModel.from_json(file)
-                control_data.update({"version": catalog.metadata.title, **catalog.control_summary(control_id)})
+        control = obj.control
 
-        return control_data
+        return {"version": control.catalog.title, **control.to_summary()}
 
     def get_component_data(self, obj: ProjectControl) -> dict:
         """Get the narratives from any Component that includes the given Control."""
@@ -160,58 +146,46 @@ class ProjectControlSerializer(serializers.ModelSerializer):
 
     @staticmethod
     def _get_control_data(obj: ProjectControl, control_id: str) -> dict:
-        type_map = {
-            Component.Status.PUBLIC: "inherited",
-            Component.Status.SYSTEM: "private"
-        }
-
         result = {
             "responsibility": "Allocated",
             "components": {"inherited": {}, "private": {"description": None}},
         }
 
         responsibilities = []
-        catalog_version = obj.project.catalog.version
         disabled_narratives = obj.disabled_narratives
-
-        for component in obj.project.components.all():
+        narratives = ComponentNarrative.objects.filter(
+            component__in=obj.project.components.all(),
+            catalog_version=obj.project.catalog.version,
+            control_id=control_id,
+        ).select_related("component").order_by("component_id")
+
+        for narrative in narratives:
+            component = narrative.component
             enabled = component.id not in disabled_narratives
-            component_def = ComponentModel(**component.component_json).component_definition.components[0]
-
-            try:
-                control_data = component_def.get_control(control_id, catalog_version=catalog_version)
-            except KeyError:
-                control_data = None
-
-            if control_data is not None:
-                responsibility = control_data.responsibility
-                responsibilities.append(responsibility)
-
-                if (status := type_map[component.status]) == "private":
-                    result["components"][status] = {
-                        "id": component.id,
-                        "description": control_data.description,
-                        "enabled": enabled
-                    }
-                else:
-                    # noinspection PyTypeChecker
-                    result["components"][status][component.title] = {
-                        "id": component.id,
-                        "description": control_data.description,
-                        "responsibility": responsibility,
-                        "provider": control_data.provider,
-                        "enabled": enabled
-                    }
-
-        if len(responsibilities) > 1:
-            result["responsibility"] = "Hybrid"
-        elif len(responsibilities) == 1:
-            result["responsibility"] = responsibilities[0]
+            responsibilities.append(narrative.responsibility)
+
+            if (status := NARRATIVE_TYPES[component.status]) == "private":
+                result["components"][status] = {
+                    "id": component.id,
+                    "description": narrative.description,
+                    "enabled": enabled
+                }
+            else:
+                # noinspection PyTypeChecker
+                result["components"][status][component.title] = {
+                    "id": component.id,
+                    "description": narrative.description,
+                    "responsibility": narrative.responsibility,
+                    "provider": narrative.provider,
+                    "enabled": enabled
+                }
+
+        result["responsibility"] = rollup_responsibility(responsibilities)
 
         return result
 
 
-class ProjectControlListSerializer(serializers.ModelSerializer):
+class ProjectControlListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     control = ControlSerializer()
     project = BasicViewProjectSerializer()
 
@@ -1,8 +1,11 @@
 import json
 import logging
 
+from typing import List
+
 from django.contrib.auth.models import Group, Permission
 from django.core.exceptions import ValidationError
+from django.db import connection
 from guardian.shortcuts import assign_perm
 
 from access_management.permission_constants import PROJECT_ADMIN_GROUP
@@ -15,12 +18,51 @@ from projects.models import Project, ProjectControl
 logger = logging.getLogger(__name__)
 
 
+def _insert_project_controls(projects_sql: str, params: list):
+    """Create a not started ProjectControl for every control of each project's catalog selected by projects_sql.
+
+    projects_sql is a condition on the project (aliased p) and control (aliased c) tables.
+    """
+    project_control = ProjectControl._meta
+    project = Project._meta
+    controls = Controls._meta
+    quote_name = connection.ops.quote_name
+
+    columns = ", ".join(
+        quote_name(project_control.get_field(name).column)
+        for name in ("project", "control", "status", "remarks", "disabled_narratives")
+    )
+    sql = (
+        f"INSERT INTO {quote_name(project_control.db_table)} ({columns}) "
+        f"SELECT p.{quote_name(project.pk.column)}, c.{quote_name(controls.pk.column)}, %s, %s, %s "
+        f"FROM {quote_name(project.db_table)} p JOIN {quote_name(controls.db_table)} c "
+        f"ON c.{quote_name(controls.get_field('catalog').column)} = "
+        f"p.{quote_name(project.get_field('catalog').column)} "
+        f"WHERE {projects_sql}"
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [ProjectControl.Status.NOT_STARTED, "", [], *params])
+
+
 def _add_project_controls(instance: Project):
-    catalog_controls = Controls.objects.filter(catalog_id=instance.catalog)
-    if catalog_controls.exists():
-        instance.controls.set(
-            catalog_controls,
-            through_defaults={"status": ProjectControl.Status.NOT_STARTED},
+    """Create a not started ProjectControl for every control in the project's catalog with one statement."""
+    _insert_project_controls(f"p.{connection.ops.quote_name(Project._meta.pk.column)} = %s", [instance.pk])
+
+
+# noinspection PyUnusedLocal
+def revise_project_controls(
+        sender, catalog: Catalog, added: List[int], removed: List[int], **kwargs
+):  # pylint: disable=unused-argument
+    """Give every project on a revised catalog its added controls, and drop the controls the catalog no longer has."""
+    ProjectControl.objects.filter(control_id__in=removed).delete()
+
+    if added:
+        quote_name = connection.ops.quote_name
+        _insert_project_controls(
+            f"p.{quote_name(Project._meta.get_field('catalog').column)} = %s "
+            f"AND c.{quote_name(Controls._meta.pk.column)} = ANY(%s)",
+            [catalog.pk, added],
         )
 
 
@@ -112,6 +112,15 @@ class ProjectModelTest(TestCase):
         private_component = self.test_project.components.get(title="Pretty Ordinary Project private")
         self.assertEqual(private_component.status, Component.Status.SYSTEM)
 
+    def test_project_controls_are_provisioned(self):
+        project_controls = ProjectControl.objects.filter(project=self.test_project)
+
+        self.assertEqual(project_controls.count(), self.test_project.catalog.controls_set.count())
+        self.assertListEqual(
+            list(project_controls.values_list("status", "remarks", "disabled_narratives").distinct()),
+            [(ProjectControl.Status.NOT_STARTED, "", [])],
+        )
+
 
 class ProjectListCreateViewTestCase(AuthenticatedAPITestCase):
     @classmethod
@@ -305,6 +314,16 @@ class ProjectComponentsTest(AuthenticatedAPITestCase):
         # ensure that response includes accurate components_count
         self.assertEqual(received_components_count, expected_num_components)
 
+    def test_project_components_omit_component_json(self):
+        path = reverse("project-detail", kwargs={"project_id": self.test_project.pk})
+
+        response = self.client.get(path)
+        self.assertTrue(all("component_json" not in component for component in response.data["components"]))
+        self.assertTrue(all(component["controls_count"] == 5 for component in response.data["components"]))
+
+        response = self.client.get(path, {"expand": "component_json"})
+        self.assertTrue(all(component["component_json"] for component in response.data["components"]))
+
 
 class ProjectAddComponentViewTest(AuthenticatedAPITestCase):
     @classmethod
@@ -778,9 +797,15 @@ class RetrieveUpdateProjectControlViewTestCase(AuthenticatedAPITestCase):
         with self.subTest(msg="Test next control"):
             self.assertEqual(content["catalog_data"]["next_id"], "ac-2")
 
+        with self.subTest(msg="Test catalog content"):
+            self.assertEqual(content["catalog_data"]["family"], "Access Control")
+            self.assertEqual(content["catalog_data"]["version"], "CMS_ARS_3_1 LOW Impact baseline")
+            self.assertTrue(content["catalog_data"]["description"].startswith("The organization:"))
+
         for field, value in expected.items():
             with self.subTest(field=field):
                 self.assertEqual(control[field], value)
+        self.assertSetEqual(set(control), {"id", "catalog", *expected})
 
         with self.subTest(msg="Test inherited components"):
             self.assertEqual(len(content["component_data"]["components"]["inherited"]), 2)
@@ -799,6 +824,12 @@ class RetrieveUpdateProjectControlViewTestCase(AuthenticatedAPITestCase):
         self.assertEqual(project["title"], "Test project")
         self.assertEqual(project["acronym"], "TP")
 
+    def test_get_project_control_fields(self):
+        response = self.client.get(self.ac_1_path, {"fields": "status,remarks"})
+        self.assertEqual(response.status_code, 200)
+
+        self.assertSetEqual(set(response.json()), {"status", "remarks"})
+
     def test_missing_control_returns_404(self):
         response = self.client.get(
             reverse("project-get-control", kwargs={"project_id": self.project.id, "control_id": "not-a-control"})
@@ -0,0 +1,181 @@
+import copy
+import json
+import os
+import tempfile
+
+from io import StringIO
+
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+
+from catalogs.models import Catalog, Controls
+from components.models import Component
+from projects.models import Project, ProjectControl
+from testing_utils import AuthenticatedAPITestCase
+from users.models import User
+
+
+class ProjectResponsibilityMatrixViewTestCase(AuthenticatedAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create()
+        token = Token.objects.create(user=user)
+
+        cls.user, cls.token = user, token
+
+        call_command("load_catalog", load_standard_catalogs=True)
+        call_command("load_components")
+
+        project = Project.objects.create(
+            title="Test project",
+            acronym="TP",
+            catalog_version=Catalog.Version.CMS_ARS_3_1,
+            impact_level=Project.ImpactLevel.LOW,
+            location="other",
+            creator=user,
+        )
+        project.components.set(Component.objects.all())
+
+        cls.project = project
+        cls.path = reverse("project-responsibility-matrix", kwargs={"project_id": project.id})
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user, token=self.token)
+
+    def test_matrix_matches_project_control(self):
+        response = self.client.get(self.path)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        content = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(content["project"], self.project.id)
+        self.assertEqual(len(content["controls"]), ProjectControl.objects.filter(project=self.project).count())
+
+        controls = {control["control_id"]: control for control in content["controls"]}
+        component_data = self.client.get(
+            reverse("project-get-control", kwargs={"project_id": self.project.id, "control_id": "ac-1"})
+        ).json()["component_data"]
+
+        self.assertEqual(controls["ac-1"]["responsibility"], component_data["responsibility"])
+        self.assertSetEqual(
+            set(controls["ac-1"]["components"]["inherited"]), set(component_data["components"]["inherited"])
+        )
+        for title, narrative in controls["ac-1"]["components"]["inherited"].items():
+            with self.subTest(component=title):
+                expected = component_data["components"]["inherited"][title]
+                self.assertEqual(narrative["id"], expected["id"])
+                self.assertEqual(narrative["provider"], expected["provider"])
+                self.assertTrue(narrative["enabled"])
+
+    def test_matrix_reports_disabled_narratives(self):
+        component = Component.objects.get(title="Amazon Web Services")
+        ProjectControl.objects.filter(project=self.project, control__control_id="ac-1").update(
+            disabled_narratives=[component.id]
+        )
+
+        content = json.loads(b"".join(self.client.get(self.path).streaming_content))
+        controls = {control["control_id"]: control for control in content["controls"]}
+
+        self.assertIs(controls["ac-1"]["components"]["inherited"]["Amazon Web Services"]["enabled"], False)
+
+    def test_missing_project_returns_404(self):
+        response = self.client.get(reverse("project-responsibility-matrix", kwargs={"project_id": 0}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class CatalogRevisionTest(TestCase):
+    def setUp(self):
+        call_command("load_catalog", catalog_file="blueprintapi/testdata/NIST_SP-800-53_rev5_test.json",
+                     name="NIST Test Catalog", catalog_version=Catalog.Version.CMS_ARS_3_1, impact_level="low")
+        self.catalog = Catalog.objects.get(name="NIST Test Catalog")
+        self.project = Project.objects.create(
+            title="Revised Project",
+            acronym="RP",
+            catalog_version=Catalog.Version.CMS_ARS_3_1,
+            impact_level=Project.ImpactLevel.LOW,
+            location="other",
+            creator=User.objects.create(),
+            catalog=self.catalog,
+        )
+
+    def _import(self, document: dict) -> str:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "NIST_SP-800-53_rev5_revised.json")
+            with open(path, "w") as file:
+                json.dump(document, file)
+
+            out = StringIO()
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command("import_catalog_revision", name="NIST Test Catalog", catalog_file=path, stdout=out)
+
+        return out.getvalue()
+
+    def test_revision_updates_controls_in_place(self):
+        with open("blueprintapi/testdata/NIST_SP-800-53_rev5_test.json") as file:
+            document = json.load(file)
+
+        access_control = document["catalog"]["groups"][0]["controls"]
+        removed = access_control.pop(1)  # ac-2, with its enhancements
+        access_control[0]["title"] = "Revised Policy and Procedures"
+        added = copy.deepcopy(access_control[0])
+        added["id"] = "ac-99"
+        access_control.append(added)
+
+        ac_1 = Controls.objects.get(catalog=self.catalog, control_id="ac-1")
+        project_controls = ProjectControl.objects.filter(project=self.project)
+        project_controls.filter(control=ac_1).update(status=ProjectControl.Status.COMPLETE)
+        count = project_controls.count()
+
+        removed_count = 1 + len(removed.get("controls", []))
+        old_path = self.catalog.file_name.path
+        output = self._import(document)
+        self.assertIn(f"1 controls added, 1 changed, {removed_count} removed", output)
+
+        ac_1.refresh_from_db()
+        self.assertEqual(ac_1.title, "Revised Policy and Procedures")
+        self.assertEqual(project_controls.get(control=ac_1).status, ProjectControl.Status.COMPLETE)
+        self.assertFalse(Controls.objects.filter(catalog=self.catalog, control_id="ac-2").exists())
+        self.assertTrue(project_controls.filter(control__control_id="ac-99").exists())
+        self.assertEqual(project_controls.count(), count + 1 - removed_count)
+        self.assertFalse(os.path.isfile(old_path))
+
+        self.assertIn("is unchanged", self._import(document))
+
+    def test_replacing_file_revises_controls(self):
+        with open("blueprintapi/testdata/NIST_SP-800-53_rev5_test.json") as file:
+            document = json.load(file)
+        document["catalog"]["groups"][0]["controls"][0]["title"] = "Revised Policy and Procedures"
+        checksum = self.catalog.checksum
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.catalog.file_name.save("NIST_SP-800-53_rev5_admin.json", ContentFile(json.dumps(document).encode()))
+
+        self.catalog.refresh_from_db()
+        self.assertNotEqual(self.catalog.checksum, checksum)
+        self.assertEqual(Controls.objects.get(catalog=self.catalog, control_id="ac-1").title,
+                         "Revised Policy and Procedures")
+        self.assertEqual(
+            ProjectControl.objects.filter(project=self.project).count(),
+            Controls.objects.filter(catalog=self.catalog).count(),
+        )
+
+    def test_rolled_back_revision_keeps_file(self):
+        old_path = self.catalog.file_name.path
+        with open(old_path, "rb") as file:
+            content = ContentFile(file.read())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                self.catalog.file_name.save("NIST_SP-800-53_rev5_rolled_back.json", content, save=False)
+                self.catalog.save()
+                raise RuntimeError
+
+        os.remove(self.catalog.file_name.path)
+        self.catalog.refresh_from_db()
+        self.assertEqual(self.catalog.file_name.path, old_path)
+        self.assertTrue(os.path.isfile(old_path))
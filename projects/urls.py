@@ -7,6 +7,7 @@ from .views import (
     RetrieveUpdateProjectControlView,
     ProjectGetControlList,
     ProjectRemoveComponentView,
+    ProjectResponsibilityMatrixView,
     ProjectsDetailView,
     ProjectsListViews,
 )
@@ -44,4 +45,9 @@ urlpatterns = [
         ProjectComponentNotAddedListView.as_view(),
         name="components-not-in-project",
     ),
+    path(
+        "<int:project_id>/responsibility-matrix/",
+        ProjectResponsibilityMatrixView.as_view(),
+        name="project-responsibility-matrix",
+    ),
 ]
@@ -1,5 +1,6 @@
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
-from django.db.models import Q, Count
+from django.db.models import Count, Prefetch, Q, QuerySet
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django_filters import rest_framework as filters
 from guardian.shortcuts import get_objects_for_user
@@ -10,10 +11,11 @@ from rest_framework.response import Response
 from blueprintapi.filters import ObjectPermissionsFilter
 from components.filters import ComponentFilter
 from components.models import Component
-from components.serializers import ComponentListBasicSerializer
+from components.serializers import ComponentListBasicSerializer, component_list_queryset
 from projects.filters import ProjectControlFilter
 from projects.models import Project, ProjectControl
 from projects.permissions import ProjectControlPermissions
+from projects.responsibility import iter_responsibility_matrix
 from projects.serializers import (
     ProjectControlSerializer,
     ProjectListSerializer,
@@ -41,6 +43,11 @@ class ProjectsDetailView(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = ProjectSerializer
     lookup_url_kwarg = "project_id"
 
+    def get_queryset(self) -> QuerySet:
+        components = component_list_queryset(Component.objects.order_by("pk"), self.request)
+
+        return super().get_queryset().prefetch_related(Prefetch("components", queryset=components))
+
 
 class ProjectAddComponentView(generics.GenericAPIView):
     queryset = Project.objects.all()
@@ -185,4 +192,21 @@ class RetrieveUpdateProjectControlView(generics.RetrieveUpdateAPIView):
         project = get_object_or_404(Project, pk=self.kwargs.get("project_id"))
         self.check_object_permissions(self.request, project)
 
-        return get_object_or_404(ProjectControl, control__control_id=self.kwargs.get("control_id"), project=project)
+        return get_object_or_404(
+            ProjectControl.objects.select_related("control__catalog"),
+            control__control_id=self.kwargs.get("control_id"),
+            project=project,
+        )
+
+
+class ProjectResponsibilityMatrixView(generics.GenericAPIView):
+    """Responsibility, component narratives and their enabled flags for every control of a project, streamed as JSON."""
+    queryset = Project.objects.select_related("catalog")
+    lookup_url_kwarg = "project_id"
+
+    def get(self, request, *args, **kwargs):
+        project = self.get_object()
+
+        # Streamed as it is read, which JsonResponse cannot do.
+        # pylint: disable-next=http-response-with-content-type-json
+        return StreamingHttpResponse(iter_responsibility_matrix(project), content_type="application/json")
@@ -1,5 +1,10 @@
 import logging
+import os
+import shutil
+import tempfile
 
+from django.test import override_settings
+from django.test.runner import DiscoverRunner
 from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
@@ -32,3 +37,27 @@ class AuthenticatedAPITestCase(APITestCase):
         user, _ = User.objects.get_or_create(username='test', is_superuser=True)
         token, _ = Token.objects.get_or_create(user=user)
         self.client.force_authenticate(user=user, token=token)
+
+
+class TemporaryMediaTestRunner(DiscoverRunner):
+    """Test runner keeping the catalog and component files that tests upload, and the catalog snapshots written for
+    them, in a temporary directory that is removed when the tests finish.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._media_dir = ""
+        self._media_settings = override_settings()
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._media_dir = tempfile.mkdtemp(prefix="blueprintapi-tests-")
+        self._media_settings = override_settings(
+            MEDIA_ROOT=os.path.join(self._media_dir, "media"),
+            CATALOG_SNAPSHOT_DIR=os.path.join(self._media_dir, "catalog_snapshots"),
+        )
+        self._media_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._media_settings.disable()
+        shutil.rmtree(self._media_dir, ignore_errors=True)
+        super().teardown_test_environment(**kwargs)
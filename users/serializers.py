@@ -1,9 +1,11 @@
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
+
+from blueprintapi.serializers import SparseFieldsetMixin
 from users.models import User
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ("id", "username", "password", "first_name", "last_name", "email", "is_active", "auth_token", )